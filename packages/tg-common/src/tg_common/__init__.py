@@ -6,9 +6,32 @@ messaging utilities, structured logging, and Prometheus metrics helpers
 used across all VoxSentinel microservices.
 """
 
-from tg_common.config import Settings, get_settings
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tg_common.config import Settings, get_settings
+
+# Public names resolved lazily (PEP 562) so importing a lightweight
+# submodule does not pull in pydantic-settings.
+_LAZY_ATTRS: dict[str, str] = {
+    "Settings": "tg_common.config",
+    "get_settings": "tg_common.config",
+}
 
 __all__ = [
     "Settings",
     "get_settings",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining *name* on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -6,11 +6,14 @@ variables and .env files. All services import their settings from this
 module to ensure consistent configuration handling.
 
 All environment variables are prefixed with ``TG_`` to avoid collisions.
+Set ``TG_USE_DOTENV=0`` in containerised deployments to skip looking for
+a ``.env`` file altogether.
 """
 
 from __future__ import annotations
 
-from functools import lru_cache
+import os
+from functools import cache
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -19,10 +22,21 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class Settings(BaseSettings):
     """Central configuration loaded from ``TG_``-prefixed environment variables.
 
+    Instances are frozen, and therefore hashable, so they can be used as
+    keys for ``functools.cache``-memoised helpers.
+
     Attributes:
         db_uri: Async PostgreSQL connection string.
         db_pool_size: SQLAlchemy connection-pool size.
+        db_max_overflow: Connections allowed beyond ``db_pool_size`` under burst load.
+        db_pool_recycle: Seconds after which pooled connections are recycled.
+        db_pool_pre_ping: Whether to test connections for liveness on checkout.
+        db_pool_timeout: Seconds to wait for a pooled connection before failing.
+        db_statement_cache_size: asyncpg per-connection statement cache size.
+        db_prepared_statement_cache_size: SQLAlchemy asyncpg prepared-statement cache size.
+        db_query_cache_size: SQLAlchemy compiled-SQL LRU cache size.
         redis_url: Redis connection URL (caching, pub/sub, state).
+        redis_max_connections: Size cap of the shared per-process Redis connection pool.
         deepgram_api_key: API key for Deepgram Nova-2.
         whisper_host: Host:port for the self-hosted Whisper server.
         asr_default_backend: Default ASR engine identifier.
@@ -42,9 +56,10 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_prefix="TG_",
-        env_file=".env",
+        env_file=".env" if os.getenv("TG_USE_DOTENV", "1") == "1" else None,
         env_file_encoding="utf-8",
         extra="ignore",
+        frozen=True,
     )
 
     # ── Database ──
@@ -53,12 +68,50 @@ class Settings(BaseSettings):
         description="Async PostgreSQL connection string.",
     )
     db_pool_size: int = Field(default=10, description="SQLAlchemy connection-pool size.")
+    db_max_overflow: int = Field(
+        default=20,
+        ge=0,
+        description="Connections allowed beyond the pool size under burst load.",
+    )
+    db_pool_recycle: int = Field(
+        default=1800,
+        description="Seconds after which pooled connections are recycled (-1 disables).",
+    )
+    db_pool_pre_ping: bool = Field(
+        default=True,
+        description="Test pooled connections for liveness on checkout.",
+    )
+    db_pool_timeout: int = Field(
+        default=30,
+        ge=1,
+        description="Seconds to wait for a pooled connection before failing.",
+    )
+    db_statement_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="asyncpg per-connection statement cache size (0 disables).",
+    )
+    db_prepared_statement_cache_size: int = Field(
+        default=512,
+        ge=0,
+        description="SQLAlchemy asyncpg prepared-statement cache size (0 disables).",
+    )
+    db_query_cache_size: int = Field(
+        default=1200,
+        ge=0,
+        description="SQLAlchemy compiled-SQL LRU cache size.",
+    )
 
     # ── Redis ──
     redis_url: str = Field(
         default="redis://localhost:6379/0",
         description="Redis connection URL.",
     )
+    redis_max_connections: int = Field(
+        default=64,
+        ge=1,
+        description="Maximum connections in the shared per-process Redis pool.",
+    )
 
     # ── ASR Backends ──
     deepgram_api_key: str = Field(default="", description="Deepgram Nova-2 API key.")
@@ -116,10 +169,16 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache(maxsize=1)
+@cache
 def get_settings() -> Settings:
     """Return the cached application settings singleton.
 
+    Pydantic compiles the ``Settings`` validator once, when the class is
+    defined, so each process pays for env-var parsing and validation exactly
+    once, on the first call.  Construction deliberately goes through
+    ``Settings()`` rather than a ``TypeAdapter`` so the ``TG_`` prefix and
+    ``.env`` sources are still applied.
+
     Returns:
         The global ``Settings`` instance.
     """
@@ -5,38 +5,96 @@ This package provides async database connection management via SQLAlchemy,
 ORM model definitions for PostgreSQL/TimescaleDB, and Alembic migration support.
 """
 
-from tg_common.db.connection import (
-    build_engine,
-    build_session_factory,
-    check_database_health,
-    get_engine,
-    get_session,
-    get_session_factory,
-)
-from tg_common.db.orm_models import (
-    AlertChannelConfigORM,
-    AlertORM,
-    AuditAnchorORM,
-    Base,
-    KeywordRuleORM,
-    SessionORM,
-    StreamORM,
-    TranscriptSegmentORM,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tg_common.db.bulk import (
+        ColumnBatch,
+        bulk_insert_alerts,
+        bulk_insert_columns,
+        bulk_insert_segments,
+    )
+    from tg_common.db.connection import (
+        build_engine,
+        build_health_engine,
+        build_session_factory,
+        check_database_health,
+        dispose_engine,
+        get_engine,
+        get_session,
+        get_session_factory,
+        init_engine,
+    )
+    from tg_common.db.orm_models import (
+        AlertChannelConfigORM,
+        AlertORM,
+        AuditAnchorORM,
+        Base,
+        KeywordRuleORM,
+        SessionORM,
+        StreamORM,
+        TranscriptSegmentORM,
+    )
+
+# Public names resolved lazily (PEP 562) so callers that only need
+# ``tg_common`` helpers do not pay the SQLAlchemy import cost.
+_LAZY_ATTRS: dict[str, str] = {
+    "ColumnBatch": "tg_common.db.bulk",
+    "bulk_insert_alerts": "tg_common.db.bulk",
+    "bulk_insert_columns": "tg_common.db.bulk",
+    "bulk_insert_segments": "tg_common.db.bulk",
+    "build_engine": "tg_common.db.connection",
+    "build_health_engine": "tg_common.db.connection",
+    "build_session_factory": "tg_common.db.connection",
+    "check_database_health": "tg_common.db.connection",
+    "dispose_engine": "tg_common.db.connection",
+    "get_engine": "tg_common.db.connection",
+    "get_session": "tg_common.db.connection",
+    "get_session_factory": "tg_common.db.connection",
+    "init_engine": "tg_common.db.connection",
+    "AlertChannelConfigORM": "tg_common.db.orm_models",
+    "AlertORM": "tg_common.db.orm_models",
+    "AuditAnchorORM": "tg_common.db.orm_models",
+    "Base": "tg_common.db.orm_models",
+    "KeywordRuleORM": "tg_common.db.orm_models",
+    "SessionORM": "tg_common.db.orm_models",
+    "StreamORM": "tg_common.db.orm_models",
+    "TranscriptSegmentORM": "tg_common.db.orm_models",
+}
 
 __all__ = [
     "AlertChannelConfigORM",
     "AlertORM",
     "AuditAnchorORM",
     "Base",
+    "ColumnBatch",
     "KeywordRuleORM",
     "SessionORM",
     "StreamORM",
     "TranscriptSegmentORM",
     "build_engine",
+    "build_health_engine",
+    "bulk_insert_alerts",
+    "bulk_insert_columns",
+    "bulk_insert_segments",
     "build_session_factory",
     "check_database_health",
+    "dispose_engine",
     "get_engine",
     "get_session",
     "get_session_factory",
+    "init_engine",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining *name* on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,245 @@
+"""
+Bulk write helpers for high-volume VoxSentinel tables.
+
+Large batches of transcript segments and alerts are written with
+PostgreSQL ``COPY`` through asyncpg's binary protocol, which avoids the
+per-row INSERT and unit-of-work overhead of the ORM.  Small batches fall
+back to ``session.add_all`` where the ORM overhead is negligible.
+
+Hot paths that do not need ORM instances at all can buffer rows in a
+column-oriented :class:`ColumnBatch` and write it with
+:func:`bulk_insert_columns`, which goes straight to COPY.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import cache
+from typing import Any
+
+from sqlalchemy import Column, inspect
+from sqlalchemy.engine import Dialect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from tg_common.db.orm_models import AlertORM, Base, TranscriptSegmentORM
+
+# Batches at or above this size are written with COPY.
+COPY_THRESHOLD = 100
+
+
+@cache
+def _column_spec(model: type[Base]) -> tuple[tuple[str, Column[Any]], ...]:
+    """Return ``(attribute key, column)`` pairs in table column order."""
+    mapper = inspect(model)
+    by_column = {col.name: key for key, col in mapper.columns.items()}
+    return tuple((by_column[col.name], col) for col in model.__table__.columns)
+
+
+_SEGMENT_COLUMNS = _column_spec(TranscriptSegmentORM)
+_ALERT_COLUMNS = _column_spec(AlertORM)
+
+
+def _default_fn(col: Column[Any]) -> Callable[[Any], Any] | None:
+    """Return a callable producing *col*'s Python-side default, if any."""
+    default = col.default
+    if default is None:
+        return None
+    if default.is_callable:
+        return default.arg  # type: ignore[attr-defined,no-any-return]
+    value = default.arg  # type: ignore[attr-defined]
+    return lambda _ctx: value
+
+
+def _to_records(
+    rows: Sequence[Base],
+    spec: tuple[tuple[str, Column[Any]], ...],
+    dialect: Dialect,
+) -> list[tuple[Any, ...]]:
+    """Convert ORM instances to COPY records.
+
+    Python-side column defaults are applied to unset attributes (and set
+    on the instance, so generated IDs are visible to the caller) and each
+    value is passed through the column type's bind processor, so JSONB and
+    custom types are encoded exactly as an ORM INSERT would encode them.
+    """
+    columns = [
+        (key, _default_fn(col), col.type.bind_processor(dialect)) for key, col in spec
+    ]
+
+    records: list[tuple[Any, ...]] = []
+    for row in rows:
+        record = []
+        for key, default_fn, processor in columns:
+            value = getattr(row, key)
+            if value is None and default_fn is not None:
+                value = default_fn(None)
+                setattr(row, key, value)
+            if processor is not None and value is not None:
+                value = processor(value)
+            record.append(value)
+        records.append(tuple(record))
+    return records
+
+
+async def _copy_rows(
+    session: AsyncSession,
+    rows: Sequence[Base],
+    spec: tuple[tuple[str, Column[Any]], ...],
+    table: str,
+) -> None:
+    """COPY *rows* into *table* on the session's current connection.
+
+    Server-default columns (e.g. ``created_at``) that a row leaves unset
+    are omitted from the COPY column list so PostgreSQL fills them in;
+    rows are grouped so each group shares one column list.
+    """
+    # Flush pending ORM objects first so COPY rows can reference them.
+    await session.flush()
+    conn = await session.connection()
+    raw = await conn.get_raw_connection()
+
+    server_keys = [
+        key for key, col in spec if col.server_default is not None and col.default is None
+    ]
+    groups: dict[frozenset[str], list[Base]] = {}
+    for row in rows:
+        omitted = frozenset(key for key in server_keys if getattr(row, key) is None)
+        groups.setdefault(omitted, []).append(row)
+
+    for omitted, group in groups.items():
+        group_spec = tuple((key, col) for key, col in spec if key not in omitted)
+        await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+            table,
+            records=_to_records(group, group_spec, conn.dialect),
+            columns=[col.name for _key, col in group_spec],
+        )
+
+
+async def bulk_insert_segments(
+    session: AsyncSession,
+    rows: Sequence[TranscriptSegmentORM],
+) -> int:
+    """Insert transcript segments, using COPY for large batches.
+
+    The rows join the session's current transaction; the caller commits.
+
+    Args:
+        session: Active async session.
+        rows: Unsaved ``TranscriptSegmentORM`` instances.
+
+    Returns:
+        Number of rows written.
+    """
+    if len(rows) < COPY_THRESHOLD:
+        session.add_all(rows)
+    else:
+        await _copy_rows(session, rows, _SEGMENT_COLUMNS, TranscriptSegmentORM.__tablename__)
+    return len(rows)
+
+
+async def bulk_insert_alerts(session: AsyncSession, rows: Sequence[AlertORM]) -> int:
+    """Insert alerts, using COPY for large batches.
+
+    The rows join the session's current transaction; the caller commits.
+
+    Args:
+        session: Active async session.
+        rows: Unsaved ``AlertORM`` instances.
+
+    Returns:
+        Number of rows written.
+    """
+    if len(rows) < COPY_THRESHOLD:
+        session.add_all(rows)
+    else:
+        await _copy_rows(session, rows, _ALERT_COLUMNS, AlertORM.__tablename__)
+    return len(rows)
+
+
+@dataclass
+class ColumnBatch:
+    """Column-oriented buffer of rows for one ORM-mapped table.
+
+    Values are kept in one list per column (keyed by ORM attribute name)
+    rather than as ORM instances, so buffering a row costs a handful of
+    list appends and :func:`bulk_insert_columns` can encode each column
+    in a single pass.
+
+    Args:
+        model: ORM class whose table the rows belong to.
+    """
+
+    model: type[Base]
+    columns: dict[str, list[Any]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.columns = {key: [] for key, _col in _column_spec(self.model)}
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def append(self, **values: Any) -> None:
+        """Buffer one row; omitted attributes are left for their defaults."""
+        unknown = values.keys() - self.columns.keys()
+        if unknown:
+            raise TypeError(
+                f"{self.model.__name__} has no column(s) {', '.join(sorted(unknown))}",
+            )
+        for key, column in self.columns.items():
+            column.append(values.get(key))
+
+
+async def bulk_insert_columns(session: AsyncSession, batch: ColumnBatch) -> int:
+    """COPY a :class:`ColumnBatch` into its table.
+
+    Python-side defaults are filled in on the batch itself, so generated
+    IDs are readable from ``batch.columns`` afterwards.  Server-default
+    columns left unset on every row are omitted so PostgreSQL fills them
+    in.  With no ORM instances to build, COPY is used at any batch size.
+    The rows join the session's current transaction; the caller commits.
+
+    Args:
+        session: Active async session.
+        batch: Buffered rows.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If a server-default column is set on only some rows.
+    """
+    count = len(batch)
+    if not count:
+        return 0
+
+    spec: list[tuple[Column[Any], list[Any]]] = []
+    for key, col in _column_spec(batch.model):
+        values = batch.columns[key]
+        default_fn = _default_fn(col)
+        if default_fn is not None:
+            values[:] = [default_fn(None) if v is None else v for v in values]
+        elif col.server_default is not None:
+            unset = sum(v is None for v in values)
+            if unset == count:
+                continue
+            if unset:
+                raise ValueError(f"{col.name!r} must be set on every row or on none")
+        spec.append((col, values))
+
+    # Flush pending ORM objects first so these rows can reference them.
+    await session.flush()
+    conn = await session.connection()
+    encoded = []
+    for col, values in spec:
+        processor = col.type.bind_processor(conn.dialect)
+        if processor is not None:
+            values = [None if v is None else processor(v) for v in values]
+        encoded.append(values)
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(  # type: ignore[union-attr]
+        batch.model.__tablename__,
+        records=list(zip(*encoded)),
+        columns=[col.name for col, _values in spec],
+    )
+    return count
@@ -8,24 +8,48 @@ for the PostgreSQL/TimescaleDB backend.
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
+from functools import cache
 
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from tg_common.config import get_settings
 
+# Compiled once; health probes hit this on every request.
+_HEALTH_STMT = text("SELECT 1")
 
-def build_engine(dsn: str | None = None, pool_size: int | None = None) -> AsyncEngine:
-    """Create an async SQLAlchemy engine.
+
+def build_engine(
+    dsn: str | None = None,
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+) -> AsyncEngine:
+    """Create an async SQLAlchemy engine backed by ``AsyncAdaptedQueuePool``.
+
+    Overflow, recycle, pre-ping and checkout-timeout behaviour are taken
+    from ``Settings`` so the pool can absorb bursty request traffic and
+    transparently replace connections dropped by the server.  Statement
+    cache sizes are also taken from ``Settings`` so frequently repeated
+    queries are compiled and prepared once per connection.
+
+    ``pool_size + max_overflow`` is the hard ceiling on concurrently
+    checked-out connections.  Size it to at least the number of sessions
+    expected to be in flight at once; any further checkout waits up to
+    ``Settings.db_pool_timeout`` seconds and then raises ``TimeoutError``.
 
     Args:
         dsn: Database connection string.  Falls back to ``Settings.db_uri``.
         pool_size: Connection-pool size.  Falls back to ``Settings.db_pool_size``.
+        max_overflow: Extra connections allowed above *pool_size*.  Falls
+            back to ``Settings.db_max_overflow``.
 
     Returns:
         A configured ``AsyncEngine`` instance.
@@ -33,14 +57,27 @@ def build_engine(dsn: str | None = None, pool_size: int | None = None) -> AsyncE
     settings = get_settings()
     return create_async_engine(
         dsn or settings.db_uri,
+        poolclass=AsyncAdaptedQueuePool,
         pool_size=pool_size or settings.db_pool_size,
+        max_overflow=settings.db_max_overflow if max_overflow is None else max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_timeout=settings.db_pool_timeout,
+        query_cache_size=settings.db_query_cache_size,
+        connect_args={
+            "statement_cache_size": settings.db_statement_cache_size,
+            "prepared_statement_cache_size": settings.db_prepared_statement_cache_size,
+        },
         echo=False,
     )
 
 
+@cache
 def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
     """Create an async session factory bound to *engine*.
 
+    Memoised per engine, so repeated calls return the same factory.
+
     Args:
         engine: The async engine to bind sessions to.
 
@@ -50,33 +87,104 @@ def build_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSessio
     return async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def build_health_engine(dsn: str | None = None) -> AsyncEngine:
+    """Create a pool-less engine reserved for health probes.
+
+    Each probe opens and closes its own connection via ``NullPool`` so a
+    liveness check never waits on the application pool, which is most
+    likely to be exhausted exactly when the service is unhealthy.
+
+    Args:
+        dsn: Database connection string.  Falls back to ``Settings.db_uri``.
+
+    Returns:
+        A ``NullPool``-backed ``AsyncEngine`` instance.
+    """
+    settings = get_settings()
+    return create_async_engine(
+        dsn or settings.db_uri,
+        poolclass=NullPool,
+        connect_args={"timeout": 2},
+        echo=False,
+    )
+
+
 # ── Module-level convenience instances ──
 
 _engine: AsyncEngine | None = None
 _session_factory: async_sessionmaker[AsyncSession] | None = None
+_health_engine: AsyncEngine | None = None
+
+
+async def init_engine(dsn: str | None = None) -> AsyncEngine:
+    """Create the shared engine and session factory, then pre-warm the pool.
+
+    Intended to be awaited once from an ASGI ``lifespan`` startup hook.
+    ``pool_size`` connections are opened concurrently and immediately
+    returned to the pool, so the first requests after startup do not
+    serialise on TCP/TLS handshakes.  Warm-up is best-effort: if the
+    database is unreachable the engine is still installed and connections
+    are established lazily on first use.
+
+    Args:
+        dsn: Database connection string.  Falls back to ``Settings.db_uri``.
+
+    Returns:
+        The shared ``AsyncEngine`` instance.
+    """
+    global _engine, _session_factory, _health_engine  # noqa: PLW0603
+    engine = build_engine(dsn)
+    _engine = engine
+    _session_factory = build_session_factory(engine)
+    _health_engine = build_health_engine(dsn)
+
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(engine.pool.size())),  # type: ignore[attr-defined]
+        return_exceptions=True,
+    )
+    for conn in results:
+        if not isinstance(conn, BaseException):
+            await conn.close()
+    return engine
+
+
+async def dispose_engine() -> None:
+    """Dispose of the shared engines created by :func:`init_engine`."""
+    global _engine, _session_factory, _health_engine  # noqa: PLW0603
+    if _engine is not None:
+        await _engine.dispose()
+    if _health_engine is not None:
+        await _health_engine.dispose()
+    _engine = None
+    _session_factory = None
+    _health_engine = None
 
 
 def get_engine() -> AsyncEngine:
-    """Return the module-level async engine, creating it lazily.
+    """Return the module-level async engine.
 
     Returns:
         The shared ``AsyncEngine`` instance.
+
+    Raises:
+        RuntimeError: If :func:`init_engine` has not been awaited.
     """
-    global _engine  # noqa: PLW0603
     if _engine is None:
-        _engine = build_engine()
+        raise RuntimeError("init_engine() must be awaited during startup")
     return _engine
 
 
 def get_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Return the module-level session factory, creating it lazily.
+    """Return the module-level session factory.
 
     Returns:
         The shared ``async_sessionmaker`` instance.
+
+    Raises:
+        RuntimeError: If :func:`init_engine` has not been awaited.
     """
-    global _session_factory  # noqa: PLW0603
     if _session_factory is None:
-        _session_factory = build_session_factory(get_engine())
+        raise RuntimeError("init_engine() must be awaited during startup")
     return _session_factory
 
 
@@ -93,17 +201,26 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
         yield session
 
 
-async def check_database_health() -> bool:
+async def check_database_health(timeout: float = 2.0) -> bool:
     """Execute a lightweight query to verify database connectivity.
 
+    Uses the dedicated ``NullPool`` health engine so probes never compete
+    with application traffic for pooled connections.
+
+    Args:
+        timeout: Upper bound in seconds for connect + query before the
+            database is reported unhealthy.
+
     Returns:
         ``True`` if the database responds, ``False`` otherwise.
     """
-    from sqlalchemy import text
-
+    engine = _health_engine
+    if engine is None:
+        return False
     try:
-        async with get_engine().connect() as conn:
-            await conn.execute(text("SELECT 1"))
+        async with asyncio.timeout(timeout):
+            async with engine.connect() as conn:
+                await conn.scalar(_HEALTH_STMT)
         return True
-    except Exception:  # noqa: BLE001 – health check must not raise
+    except Exception:  # noqa: BLE001 – health check must not raise (incl. timeout)
         return False
@@ -0,0 +1,39 @@
+"""Shared helpers for revisions under ``versions/``."""
+
+from __future__ import annotations
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+def is_hypertable(table: str) -> bool:
+    """Return whether *table* is a TimescaleDB hypertable.
+
+    Always ``False`` in offline (``--sql``) mode, where there is no
+    database to inspect.
+    """
+    if context.is_offline_mode():
+        return False
+    bind = op.get_bind()
+    has_timescale = bind.execute(
+        sa.text("SELECT to_regclass('timescaledb_information.hypertables') IS NOT NULL"),
+    ).scalar()
+    if not has_timescale:
+        return False
+    row = bind.execute(
+        sa.text(
+            "SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = :t",
+        ),
+        {"t": table},
+    ).first()
+    return row is not None
+
+
+def concurrently(table: str) -> bool:
+    """Return whether *table* supports ``CREATE INDEX CONCURRENTLY``.
+
+    TimescaleDB rejects concurrent index builds on hypertables
+    (``transcript_segments`` and ``alerts`` are hypertables when the
+    extension is installed).
+    """
+    return not is_hypertable(table)
@@ -0,0 +1,49 @@
+"""foreign key and time indexes
+
+Revision ID: 1c4e7a9b2d38
+Revises: 5dc94ab43cad
+Create Date: 2026-10-17 02:43:05.118204
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1c4e7a9b2d38'
+down_revision: Union[str, None] = '5dc94ab43cad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # PostgreSQL does not index the referencing side of a foreign key; the
+    # composite indexes lead with stream_id so they double as that
+    # column's FK index.
+    op.create_index("ix_sessions_stream_id", "sessions", ["stream_id"])
+    op.create_index("ix_transcript_segments_session_id", "transcript_segments", ["session_id"])
+    op.create_index(
+        "ix_transcript_segments_stream_id_start_time",
+        "transcript_segments",
+        ["stream_id", sa.text("start_time DESC")],
+    )
+    op.create_index("ix_alerts_session_id", "alerts", ["session_id"])
+    op.create_index("ix_alerts_segment_id", "alerts", ["segment_id"])
+    op.create_index(
+        "ix_alerts_stream_id_created_at",
+        "alerts",
+        ["stream_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_stream_id_created_at", table_name="alerts")
+    op.drop_index("ix_alerts_segment_id", table_name="alerts")
+    op.drop_index("ix_alerts_session_id", table_name="alerts")
+    op.drop_index("ix_transcript_segments_stream_id_start_time", table_name="transcript_segments")
+    op.drop_index("ix_transcript_segments_session_id", table_name="transcript_segments")
+    op.drop_index("ix_sessions_stream_id", table_name="sessions")
@@ -0,0 +1,135 @@
+"""timescale hypertables
+
+Revision ID: 3e8b5d1f9a62
+Revises: 1c4e7a9b2d38
+Create Date: 2026-10-17 02:43:42.530917
+
+Converts ``transcript_segments`` (on ``start_time``) and ``alerts`` (on
+``created_at``) to TimescaleDB hypertables with 1-day chunks and a
+retention policy.  Both steps are no-ops unless the ``timescaledb``
+extension is installed.
+
+The retention window is fixed when the policy is created.  It defaults
+to 90 days (the ``Settings.retention_days`` default) and is set with
+``alembic -x retention_days=N upgrade head``; changing it later needs
+``remove_retention_policy`` / ``add_retention_policy`` by hand.
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import context, op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b5d1f9a62'
+down_revision: Union[str, None] = '1c4e7a9b2d38'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_DEFAULT_RETENTION_DAYS = 90
+
+# (table, primary-key column, time column), in conversion order.
+_HYPERTABLES = (
+    ("transcript_segments", "segment_id", "start_time"),
+    ("alerts", "alert_id", "created_at"),
+)
+
+
+def _retention_days() -> int:
+    """Return the ``-x retention_days`` argument, or the default."""
+    value = context.get_x_argument(as_dictionary=True).get("retention_days")
+    days = int(value) if value is not None else _DEFAULT_RETENTION_DAYS
+    if days < 1:
+        raise ValueError(f"retention_days must be at least 1, got {days}")
+    return days
+
+
+def _to_hypertable_sql(table: str, pk: str, time_col: str, retention_days: int) -> str:
+    """Return statements converting *table* to a hypertable.
+
+    TimescaleDB requires every unique constraint to include the
+    partitioning column, so the primary key gains *time_col*.
+    """
+    return f"""
+    IF NOT EXISTS (
+      SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = '{table}'
+    ) THEN
+      ALTER TABLE {table} DROP CONSTRAINT {table}_pkey;
+      ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk}, {time_col});
+      PERFORM create_hypertable('{table}', '{time_col}',
+          chunk_time_interval => INTERVAL '1 day', migrate_data => TRUE);
+    END IF;
+    PERFORM add_retention_policy('{table}', INTERVAL '{retention_days} days',
+        if_not_exists => TRUE);"""
+
+
+def _to_plain_table_sql(table: str, pk: str) -> str:
+    """Return statements copying hypertable *table* back into a plain table.
+
+    TimescaleDB cannot convert a hypertable back in place.  Secondary
+    indexes and foreign keys are recreated from their definitions, except
+    the time index ``create_hypertable`` added on its own.
+    """
+    return f"""
+    PERFORM remove_retention_policy('{table}', if_exists => TRUE);
+    IF EXISTS (
+      SELECT 1 FROM timescaledb_information.hypertables WHERE hypertable_name = '{table}'
+    ) THEN
+      SELECT coalesce(array_agg(pg_get_indexdef(i.indexrelid)), '{{}}') INTO index_defs
+        FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid
+        WHERE i.indrelid = '{table}'::regclass AND NOT i.indisprimary
+          AND c.relname NOT IN (
+            SELECT format('%s_%s_idx', '{table}', column_name)
+              FROM timescaledb_information.dimensions WHERE hypertable_name = '{table}'
+          );
+      SELECT coalesce(array_agg(format('ALTER TABLE {table} ADD CONSTRAINT %I %s',
+                                       conname, pg_get_constraintdef(oid))), '{{}}')
+        INTO fk_defs
+        FROM pg_constraint WHERE conrelid = '{table}'::regclass AND contype = 'f';
+
+      CREATE TABLE {table}_plain (LIKE {table} INCLUDING DEFAULTS INCLUDING CONSTRAINTS);
+      INSERT INTO {table}_plain SELECT * FROM {table};
+      DROP TABLE {table};
+      ALTER TABLE {table}_plain RENAME TO {table};
+      ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({pk});
+      FOREACH stmt IN ARRAY index_defs || fk_defs LOOP
+        EXECUTE stmt;
+      END LOOP;
+    END IF;"""
+
+
+def upgrade() -> None:
+    retention_days = _retention_days()
+    body = "".join(
+        _to_hypertable_sql(table, pk, time_col, retention_days)
+        for table, pk, time_col in _HYPERTABLES
+    )
+    op.execute(
+        f"""DO $$ BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN
+    -- A hypertable's segment_id is not unique on its own, so nothing can
+    -- reference it; the column and its index remain.
+    ALTER TABLE alerts DROP CONSTRAINT IF EXISTS alerts_segment_id_fkey;{body}
+  END IF;
+END $$"""
+    )
+
+
+def downgrade() -> None:
+    body = "".join(_to_plain_table_sql(table, pk) for table, pk, _ in reversed(_HYPERTABLES))
+    op.execute(
+        f"""DO $$
+DECLARE
+  index_defs text[];
+  fk_defs text[];
+  stmt text;
+BEGIN
+  IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'timescaledb') THEN{body}
+    IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'alerts_segment_id_fkey') THEN
+      ALTER TABLE alerts ADD CONSTRAINT alerts_segment_id_fkey
+          FOREIGN KEY (segment_id) REFERENCES transcript_segments(segment_id);
+    END IF;
+  END IF;
+END $$"""
+    )
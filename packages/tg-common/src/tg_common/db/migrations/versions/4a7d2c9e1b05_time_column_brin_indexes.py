@@ -0,0 +1,43 @@
+"""time column brin indexes
+
+Revision ID: 4a7d2c9e1b05
+Revises: 3e8b5d1f9a62
+Create Date: 2026-10-17 02:45:03.118274
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a7d2c9e1b05'
+down_revision: Union[str, None] = '3e8b5d1f9a62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # BRIN indexes for range scans over the append-only timestamp columns;
+    # a fraction of the size of an equivalent B-tree.
+    op.create_index(
+        "ix_transcript_segments_start_time_brin",
+        "transcript_segments",
+        ["start_time"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_alerts_created_at_brin",
+        "alerts",
+        ["created_at"],
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_created_at_brin", table_name="alerts")
+    op.drop_index("ix_transcript_segments_start_time_brin", table_name="transcript_segments")
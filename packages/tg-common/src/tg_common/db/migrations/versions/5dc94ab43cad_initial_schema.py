@@ -20,46 +20,70 @@ down_revision: Union[str, None] = None
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
-# Custom enum types
-source_type_enum = sa.Enum(
+# Custom enum types.  ``create_type=False`` because all types are created in
+# a single round-trip by ``_CREATE_ENUMS_SQL`` rather than one
+# check-then-create pair per type.
+source_type_enum = postgresql.ENUM(
     "rtsp", "hls", "dash", "webrtc", "sip", "file", "meeting_relay",
     name="source_type_enum",
+    create_type=False,
 )
-stream_status_enum = sa.Enum(
+stream_status_enum = postgresql.ENUM(
     "active", "paused", "error", "stopped",
     name="stream_status_enum",
+    create_type=False,
 )
-alert_type_enum = sa.Enum(
+alert_type_enum = postgresql.ENUM(
     "keyword", "sentiment", "compliance", "intent",
     name="alert_type_enum",
+    create_type=False,
 )
-severity_enum = sa.Enum(
+severity_enum = postgresql.ENUM(
     "low", "medium", "high", "critical",
     name="severity_enum",
+    create_type=False,
 )
-match_type_enum = sa.Enum(
+match_type_enum = postgresql.ENUM(
     "exact", "fuzzy", "regex", "sentiment_threshold", "intent",
     name="match_type_enum",
+    create_type=False,
 )
-rule_match_type_enum = sa.Enum(
+rule_match_type_enum = postgresql.ENUM(
     "exact", "fuzzy", "regex",
     name="rule_match_type_enum",
+    create_type=False,
 )
-channel_type_enum = sa.Enum(
+channel_type_enum = postgresql.ENUM(
     "websocket", "webhook", "slack", "teams", "email", "sms", "signal",
     name="channel_type_enum",
+    create_type=False,
 )
 
+_ENUMS = (
+    source_type_enum,
+    stream_status_enum,
+    alert_type_enum,
+    severity_enum,
+    match_type_enum,
+    rule_match_type_enum,
+    channel_type_enum,
+)
+
+# One DO block creates every enum; existing types are skipped, preserving
+# the previous ``checkfirst=True`` semantics.
+_CREATE_ENUMS_SQL = "DO $$ BEGIN\n" + "\n".join(
+    f"  BEGIN CREATE TYPE {e.name} AS ENUM ("
+    + ", ".join(f"'{v}'" for v in e.enums)
+    + "); EXCEPTION WHEN duplicate_object THEN NULL; END;"
+    for e in _ENUMS
+) + "\nEND $$"
+
+_DROP_ENUMS_SQL = "DROP TYPE IF EXISTS " + ", ".join(e.name for e in reversed(_ENUMS))
+
 
 def upgrade() -> None:
     # Create enum types
-    source_type_enum.create(op.get_bind(), checkfirst=True)
-    stream_status_enum.create(op.get_bind(), checkfirst=True)
-    alert_type_enum.create(op.get_bind(), checkfirst=True)
-    severity_enum.create(op.get_bind(), checkfirst=True)
-    match_type_enum.create(op.get_bind(), checkfirst=True)
-    rule_match_type_enum.create(op.get_bind(), checkfirst=True)
-    channel_type_enum.create(op.get_bind(), checkfirst=True)
+    op.execute(_CREATE_ENUMS_SQL)
 
     # streams
     op.create_table(
@@ -191,10 +215,4 @@ def downgrade() -> None:
     op.drop_table("sessions")
     op.drop_table("streams")
 
-    channel_type_enum.drop(op.get_bind(), checkfirst=True)
-    rule_match_type_enum.drop(op.get_bind(), checkfirst=True)
-    match_type_enum.drop(op.get_bind(), checkfirst=True)
-    severity_enum.drop(op.get_bind(), checkfirst=True)
-    alert_type_enum.drop(op.get_bind(), checkfirst=True)
-    stream_status_enum.drop(op.get_bind(), checkfirst=True)
-    source_type_enum.drop(op.get_bind(), checkfirst=True)
+    op.execute(_DROP_ENUMS_SQL)
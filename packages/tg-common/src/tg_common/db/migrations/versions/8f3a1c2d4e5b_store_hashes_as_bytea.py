@@ -0,0 +1,42 @@
+"""store hashes as bytea
+
+Revision ID: 8f3a1c2d4e5b
+Revises: 4a7d2c9e1b05
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8f3a1c2d4e5b'
+down_revision: Union[str, None] = '4a7d2c9e1b05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hex-encoded SHA-256 (64 chars) -> raw 32-byte digests.
+    op.execute(
+        "ALTER TABLE transcript_segments "
+        "ALTER COLUMN segment_hash TYPE BYTEA USING decode(segment_hash, 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE audit_anchors "
+        "ALTER COLUMN merkle_root TYPE BYTEA USING decode(merkle_root, 'hex')"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE audit_anchors "
+        "ALTER COLUMN merkle_root TYPE VARCHAR(64) USING encode(merkle_root, 'hex')"
+    )
+    op.execute(
+        "ALTER TABLE transcript_segments "
+        "ALTER COLUMN segment_hash TYPE VARCHAR(64) USING encode(segment_hash, 'hex')"
+    )
@@ -0,0 +1,48 @@
+"""sentiment label enum
+
+Revision ID: a6c3f8e2d915
+Revises: f5b1d0e83a27
+Create Date: 2026-10-17 02:54:45.664125
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3f8e2d915'
+down_revision: Union[str, None] = 'f5b1d0e83a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # A 4-byte enum OID replaces a repeated varlena string on every segment.
+    op.execute(
+        "DO $$ BEGIN "
+        "CREATE TYPE sentiment_label_enum AS ENUM ('positive', 'neutral', 'negative'); "
+        "EXCEPTION WHEN duplicate_object THEN NULL; "
+        "END $$"
+    )
+    # Labels outside the enum (e.g. from a non-SST-2 model) become NULL
+    # rather than aborting the conversion.
+    op.execute(
+        "ALTER TABLE transcript_segments "
+        "ALTER COLUMN sentiment_label TYPE sentiment_label_enum "
+        "USING CASE lower(sentiment_label) "
+        "WHEN 'positive' THEN 'positive'::sentiment_label_enum "
+        "WHEN 'neutral' THEN 'neutral'::sentiment_label_enum "
+        "WHEN 'negative' THEN 'negative'::sentiment_label_enum "
+        "ELSE NULL END"
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE transcript_segments "
+        "ALTER COLUMN sentiment_label TYPE VARCHAR(20) USING sentiment_label::text"
+    )
+    op.execute("DROP TYPE IF EXISTS sentiment_label_enum")
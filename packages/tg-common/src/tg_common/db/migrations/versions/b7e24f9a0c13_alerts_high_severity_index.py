@@ -0,0 +1,35 @@
+"""alerts high severity index
+
+Revision ID: b7e24f9a0c13
+Revises: 8f3a1c2d4e5b
+Create Date: 2026-10-17 10:04:52.771930
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e24f9a0c13'
+down_revision: Union[str, None] = '8f3a1c2d4e5b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Dashboards mostly read high/critical alerts, a small fraction of rows;
+    # a partial index lets those reads skip everything else.
+    op.create_index(
+        "ix_alerts_high_severity_created_at",
+        "alerts",
+        [sa.text("created_at DESC")],
+        postgresql_where=sa.text("severity IN ('high', 'critical')"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_alerts_high_severity_created_at", table_name="alerts")
@@ -0,0 +1,43 @@
+"""jsonb gin indexes
+
+Revision ID: c41d8e2b7f60
+Revises: b7e24f9a0c13
+Create Date: 2026-10-17 10:31:07.402566
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d8e2b7f60'
+down_revision: Union[str, None] = 'b7e24f9a0c13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) — GIN with jsonb_path_ops for @> containment.
+_GIN_INDEXES = (
+    ("ix_transcript_segments_intent_labels_gin", "transcript_segments", "intent_labels"),
+    ("ix_transcript_segments_pii_entities_found_gin", "transcript_segments", "pii_entities_found"),
+    ("ix_transcript_segments_word_timestamps_gin", "transcript_segments", "word_timestamps"),
+    ("ix_alerts_sentiment_scores_gin", "alerts", "sentiment_scores"),
+)
+
+
+def upgrade() -> None:
+    for name, table, column in _GIN_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            postgresql_using="gin",
+            postgresql_ops={column: "jsonb_path_ops"},
+        )
+
+
+def downgrade() -> None:
+    for name, table, _column in reversed(_GIN_INDEXES):
+        op.drop_index(name, table_name=table)
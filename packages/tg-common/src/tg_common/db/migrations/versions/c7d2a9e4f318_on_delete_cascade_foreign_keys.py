@@ -0,0 +1,91 @@
+"""on delete cascade foreign keys
+
+Revision ID: c7d2a9e4f318
+Revises: b38e5d7a1c40
+Create Date: 2026-10-17 03:00:39.347082
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from tg_common.db.migrations._helpers import is_hypertable
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7d2a9e4f318'
+down_revision: Union[str, None] = 'b38e5d7a1c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (constraint, table, column, referenced table.column)
+_FOREIGN_KEYS = (
+    ("sessions_stream_id_fkey", "sessions", "stream_id", "streams(stream_id)"),
+    (
+        "transcript_segments_session_id_fkey",
+        "transcript_segments",
+        "session_id",
+        "sessions(session_id)",
+    ),
+    (
+        "transcript_segments_stream_id_fkey",
+        "transcript_segments",
+        "stream_id",
+        "streams(stream_id)",
+    ),
+    ("alerts_session_id_fkey", "alerts", "session_id", "sessions(session_id)"),
+    ("alerts_stream_id_fkey", "alerts", "stream_id", "streams(stream_id)"),
+    (
+        "alerts_segment_id_fkey",
+        "alerts",
+        "segment_id",
+        "transcript_segments(segment_id)",
+    ),
+)
+
+
+def _replace_foreign_keys(on_delete: str) -> None:
+    """Recreate each foreign key with the given ``ON DELETE`` action.
+
+    Constraints that do not exist are skipped; ``alerts_segment_id_fkey``
+    is dropped by the TimescaleDB hypertable conversion.  Each swap runs
+    in its own transaction and adds the constraint ``NOT VALID``, so the
+    ``ACCESS EXCLUSIVE`` lock is released before ``VALIDATE`` scans the
+    existing rows under a ``SHARE UPDATE EXCLUSIVE`` lock in a second
+    transaction.  Hypertables get a validated constraint directly.
+    """
+    with op.get_context().autocommit_block():
+        for name, table, column, target in _FOREIGN_KEYS:
+            online = not is_hypertable(table)
+            op.execute(
+                f"""DO $$ BEGIN
+  IF EXISTS (SELECT 1 FROM pg_constraint WHERE conname = '{name}') THEN
+    ALTER TABLE {table} DROP CONSTRAINT {name};
+    ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({column})
+        REFERENCES {target} ON DELETE {on_delete}{" NOT VALID" if online else ""};
+  END IF;
+END $$"""
+            )
+            if online:
+                op.execute(
+                    f"""DO $$ BEGIN
+  IF EXISTS (
+    SELECT 1 FROM pg_constraint WHERE conname = '{name}' AND NOT convalidated
+  ) THEN
+    ALTER TABLE {table} VALIDATE CONSTRAINT {name};
+  END IF;
+END $$"""
+                )
+
+
+def upgrade() -> None:
+    # Deleting a stream or session removes its children in one statement
+    # instead of the ORM loading and deleting every child row.
+    _replace_foreign_keys("CASCADE")
+
+
+def downgrade() -> None:
+    _replace_foreign_keys("NO ACTION")
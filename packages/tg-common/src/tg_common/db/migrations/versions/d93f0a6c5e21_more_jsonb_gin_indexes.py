@@ -0,0 +1,53 @@
+"""more jsonb gin indexes
+
+Revision ID: d93f0a6c5e21
+Revises: c41d8e2b7f60
+Create Date: 2026-10-17 11:18:26.905113
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from tg_common.db.migrations._helpers import concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd93f0a6c5e21'
+down_revision: Union[str, None] = 'c41d8e2b7f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, column) — GIN with jsonb_path_ops for @> containment.
+_GIN_INDEXES = (
+    ("ix_alerts_delivered_to_gin", "alerts", "delivered_to"),
+    ("ix_alerts_delivery_status_gin", "alerts", "delivery_status"),
+    ("ix_alert_channel_configs_alert_types_gin", "alert_channel_configs", "alert_types"),
+    ("ix_alert_channel_configs_stream_ids_gin", "alert_channel_configs", "stream_ids"),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, table, column in _GIN_INDEXES:
+            op.create_index(
+                name,
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "jsonb_path_ops"},
+                postgresql_concurrently=concurrently(table),
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _column in reversed(_GIN_INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                postgresql_concurrently=concurrently(table),
+            )
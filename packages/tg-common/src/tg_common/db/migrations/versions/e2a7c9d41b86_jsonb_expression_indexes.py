@@ -0,0 +1,63 @@
+"""jsonb expression indexes
+
+Revision ID: e2a7c9d41b86
+Revises: d93f0a6c5e21
+Create Date: 2026-10-17 02:50:23.791459
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tg_common.db.migrations._helpers import concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a7c9d41b86'
+down_revision: Union[str, None] = 'd93f0a6c5e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# GIN jsonb_path_ops only serves ``@>``; these B-tree indexes serve the
+# ``->>`` leaf lookups and range filters the dashboard runs.
+_EXPRESSION_INDEXES = (
+    (
+        "ix_alerts_negative_sentiment",
+        sa.text("((sentiment_scores ->> 'negative')::float8)"),
+        sa.text("sentiment_scores ? 'negative'"),
+    ),
+    (
+        "ix_alerts_undelivered_created_at",
+        sa.text("created_at DESC"),
+        sa.text(
+            "jsonb_path_exists(delivery_status, "
+            "'$.* ? (@ == \"failed\" || @ == \"error\")')",
+        ),
+    ),
+)
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        for name, expression, where in _EXPRESSION_INDEXES:
+            op.create_index(
+                name,
+                "alerts",
+                [expression],
+                postgresql_where=where,
+                postgresql_concurrently=concurrently("alerts"),
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _expression, _where in reversed(_EXPRESSION_INDEXES):
+            op.drop_index(
+                name,
+                table_name="alerts",
+                postgresql_concurrently=concurrently("alerts"),
+            )
@@ -0,0 +1,87 @@
+"""covering stream and session indexes
+
+Revision ID: f5b1d0e83a27
+Revises: e2a7c9d41b86
+Create Date: 2026-10-17 02:50:57.676451
+
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from tg_common.db.migrations._helpers import concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5b1d0e83a27'
+down_revision: Union[str, None] = 'e2a7c9d41b86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block.  Each new index
+    # has the old one as a prefix, so the old one is dropped afterwards,
+    # tolerating one that was already removed by hand.
+    with op.get_context().autocommit_block():
+        alerts = concurrently("alerts")
+        segments = concurrently("transcript_segments")
+        # INCLUDE lets severity/type breakdowns be answered index-only.
+        op.create_index(
+            "ix_alerts_stream_created_desc",
+            "alerts",
+            ["stream_id", sa.text("created_at DESC")],
+            postgresql_include=["severity", "alert_type"],
+            postgresql_concurrently=alerts,
+        )
+        op.drop_index(
+            "ix_alerts_stream_id_created_at",
+            table_name="alerts",
+            if_exists=True,
+            postgresql_concurrently=alerts,
+        )
+        op.create_index(
+            "ix_transcript_segments_session_id_start_time",
+            "transcript_segments",
+            ["session_id", "start_time"],
+            postgresql_concurrently=segments,
+        )
+        op.drop_index(
+            "ix_transcript_segments_session_id",
+            table_name="transcript_segments",
+            if_exists=True,
+            postgresql_concurrently=segments,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        alerts = concurrently("alerts")
+        segments = concurrently("transcript_segments")
+        op.create_index(
+            "ix_transcript_segments_session_id",
+            "transcript_segments",
+            ["session_id"],
+            if_not_exists=True,
+            postgresql_concurrently=segments,
+        )
+        op.drop_index(
+            "ix_transcript_segments_session_id_start_time",
+            table_name="transcript_segments",
+            postgresql_concurrently=segments,
+        )
+        op.create_index(
+            "ix_alerts_stream_id_created_at",
+            "alerts",
+            ["stream_id", sa.text("created_at DESC")],
+            if_not_exists=True,
+            postgresql_concurrently=alerts,
+        )
+        op.drop_index(
+            "ix_alerts_stream_created_desc",
+            table_name="alerts",
+            postgresql_concurrently=alerts,
+        )
@@ -5,12 +5,16 @@ Defines the database table mappings for streams, sessions, transcript
 segments, alerts, keyword rules, alert channel configurations, and
 audit anchors using SQLAlchemy 2.0 declarative style with
 ``MappedColumn`` / ``mapped_column``.
+
+Relationships use ``lazy="raise_on_sql"``: touching an unloaded one raises
+instead of silently issuing a query per parent, so callers must request it
+up front, e.g. ``select(SessionORM).options(selectinload(SessionORM.alerts))``.
 """
 
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Any
 
 from sqlalchemy import (
@@ -20,17 +24,47 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
+    func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
+from sqlalchemy.engine import Dialect
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import TypeDecorator
+
+from tg_common.utils import uuid7
+
+
+class Sha256Digest(TypeDecorator[str]):
+    """SHA-256 digest stored as 32 raw bytes but exposed as a hex string.
+
+    Halves on-disk and index size compared with ``VARCHAR(64)`` while
+    keeping the hex representation used by hashing and Merkle code.
+    """
 
+    impl = LargeBinary(32)
+    cache_ok = True
 
-def _utc_now() -> datetime:
-    """Return timezone-aware UTC now for server defaults."""
-    return datetime.now(timezone.utc)
+    def process_bind_param(self, value: str | None, dialect: Dialect) -> bytes | None:
+        return None if value is None else bytes.fromhex(value)
+
+    def process_result_value(self, value: bytes | None, dialect: Dialect) -> str | None:
+        return None if value is None else bytes(value).hex()
+
+
+def _jsonb_gin_index(table: str, column: str) -> Index:
+    """Return a ``GIN (column jsonb_path_ops)`` index for ``@>`` containment queries."""
+    return Index(
+        f"ix_{table}_{column}_gin",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "jsonb_path_ops"},
+    )
 
 
 # ── Base class ──
@@ -66,6 +100,10 @@ RULE_MATCH_TYPE_ENUM = Enum(
     "exact", "fuzzy", "regex",
     name="rule_match_type_enum",
 )
+SENTIMENT_LABEL_ENUM = Enum(
+    "positive", "neutral", "negative",
+    name="sentiment_label_enum",
+)
 CHANNEL_TYPE_ENUM = Enum(
     "websocket", "webhook", "slack", "teams", "email", "sms", "signal",
     name="channel_type_enum",
@@ -79,9 +117,12 @@ class StreamORM(Base):
     """ORM model for the ``streams`` table."""
 
     __tablename__ = "streams"
+    # Fetch server-generated updated_at via RETURNING so it is readable
+    # after commit without a lazy load.
+    __mapper_args__ = {"eager_defaults": True}
 
     stream_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     source_type: Mapped[str] = mapped_column(SOURCE_TYPE_ENUM, nullable=False)
@@ -98,10 +139,10 @@ class StreamORM(Base):
         PG_UUID(as_uuid=True), nullable=True,
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now(),
     )
     metadata_: Mapped[dict[str, Any] | None] = mapped_column(
         "metadata", JSONB, nullable=True,
@@ -109,7 +150,10 @@ class StreamORM(Base):
 
     # Relationships
     sessions: Mapped[list[SessionORM]] = relationship(
-        back_populates="stream", cascade="all, delete-orphan",
+        back_populates="stream",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -119,13 +163,16 @@ class SessionORM(Base):
     __tablename__ = "sessions"
 
     session_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     stream_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("streams.stream_id"), nullable=False,
+        PG_UUID(as_uuid=True),
+        ForeignKey("streams.stream_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     started_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
     ended_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True,
@@ -137,12 +184,20 @@ class SessionORM(Base):
     total_alerts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
 
     # Relationships
-    stream: Mapped[StreamORM] = relationship(back_populates="sessions")
+    stream: Mapped[StreamORM] = relationship(
+        back_populates="sessions", lazy="raise_on_sql",
+    )
     segments: Mapped[list[TranscriptSegmentORM]] = relationship(
-        back_populates="session", cascade="all, delete-orphan",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
     alerts: Mapped[list[AlertORM]] = relationship(
-        back_populates="session", cascade="all, delete-orphan",
+        back_populates="session",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -150,15 +205,43 @@ class TranscriptSegmentORM(Base):
     """ORM model for the ``transcript_segments`` table."""
 
     __tablename__ = "transcript_segments"
+    __table_args__ = (
+        # Leading stream_id / session_id also serve FK lookups on those columns.
+        Index(
+            "ix_transcript_segments_stream_id_start_time",
+            "stream_id",
+            text("start_time DESC"),
+        ),
+        Index("ix_transcript_segments_session_id_start_time", "session_id", "start_time"),
+        Index(
+            "ix_transcript_segments_start_time_brin",
+            "start_time",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_transcript_segments_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        _jsonb_gin_index("transcript_segments", "intent_labels"),
+        _jsonb_gin_index("transcript_segments", "pii_entities_found"),
+        _jsonb_gin_index("transcript_segments", "word_timestamps"),
+    )
 
     segment_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     session_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("sessions.session_id"), nullable=False,
+        PG_UUID(as_uuid=True),
+        ForeignKey("sessions.session_id", ondelete="CASCADE"),
+        nullable=False,
     )
     stream_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("streams.stream_id"), nullable=False,
+        PG_UUID(as_uuid=True),
+        ForeignKey("streams.stream_id", ondelete="CASCADE"),
+        nullable=False,
     )
     speaker_id: Mapped[str | None] = mapped_column(String(100), nullable=True)
     start_time: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -173,19 +256,22 @@ class TranscriptSegmentORM(Base):
         String(100), nullable=False, default="deepgram_nova2",
     )
     asr_confidence: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    sentiment_label: Mapped[str | None] = mapped_column(String(20), nullable=True)
+    sentiment_label: Mapped[str | None] = mapped_column(SENTIMENT_LABEL_ENUM, nullable=True)
     sentiment_score: Mapped[float | None] = mapped_column(Float, nullable=True)
     intent_labels: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     pii_entities_found: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
-    segment_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    segment_hash: Mapped[str | None] = mapped_column(Sha256Digest, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
 
     # Relationships
-    session: Mapped[SessionORM] = relationship(back_populates="segments")
+    session: Mapped[SessionORM] = relationship(back_populates="segments", lazy="raise_on_sql")
     alerts: Mapped[list[AlertORM]] = relationship(
-        back_populates="segment", cascade="all, delete-orphan",
+        back_populates="segment",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
     )
 
 
@@ -193,20 +279,63 @@ class AlertORM(Base):
     """ORM model for the ``alerts`` table."""
 
     __tablename__ = "alerts"
+    __table_args__ = (
+        # Leading stream_id also serves FK lookups on that column.
+        # INCLUDE lets severity/type breakdowns be answered index-only.
+        Index(
+            "ix_alerts_stream_created_desc",
+            "stream_id",
+            text("created_at DESC"),
+            postgresql_include=["severity", "alert_type"],
+        ),
+        Index(
+            "ix_alerts_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index(
+            "ix_alerts_high_severity_created_at",
+            text("created_at DESC"),
+            postgresql_where=text("severity IN ('high', 'critical')"),
+        ),
+        Index(
+            "ix_alerts_negative_sentiment",
+            text("((sentiment_scores ->> 'negative')::float8)"),
+            postgresql_where=text("sentiment_scores ? 'negative'"),
+        ),
+        Index(
+            "ix_alerts_undelivered_created_at",
+            text("created_at DESC"),
+            postgresql_where=text(
+                "jsonb_path_exists(delivery_status, "
+                "'$.* ? (@ == \"failed\" || @ == \"error\")')",
+            ),
+        ),
+        _jsonb_gin_index("alerts", "sentiment_scores"),
+        _jsonb_gin_index("alerts", "delivered_to"),
+        _jsonb_gin_index("alerts", "delivery_status"),
+    )
 
     alert_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     session_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("sessions.session_id"), nullable=False,
+        PG_UUID(as_uuid=True),
+        ForeignKey("sessions.session_id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
     )
     stream_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), ForeignKey("streams.stream_id"), nullable=False,
+        PG_UUID(as_uuid=True),
+        ForeignKey("streams.stream_id", ondelete="CASCADE"),
+        nullable=False,
     )
     segment_id: Mapped[uuid.UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
-        ForeignKey("transcript_segments.segment_id"),
+        ForeignKey("transcript_segments.segment_id", ondelete="CASCADE"),
         nullable=True,
+        index=True,
     )
     alert_type: Mapped[str] = mapped_column(ALERT_TYPE_ENUM, nullable=False)
     severity: Mapped[str] = mapped_column(SEVERITY_ENUM, nullable=False)
@@ -223,21 +352,26 @@ class AlertORM(Base):
     delivery_status: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     deduplicated: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
 
     # Relationships
-    session: Mapped[SessionORM] = relationship(back_populates="alerts")
-    segment: Mapped[TranscriptSegmentORM | None] = relationship(back_populates="alerts")
+    session: Mapped[SessionORM] = relationship(back_populates="alerts", lazy="raise_on_sql")
+    segment: Mapped[TranscriptSegmentORM | None] = relationship(
+        back_populates="alerts", lazy="raise_on_sql",
+    )
 
 
 class KeywordRuleORM(Base):
     """ORM model for the ``keyword_rules`` table."""
 
     __tablename__ = "keyword_rules"
+    # Fetch server-generated updated_at via RETURNING so it is readable
+    # after commit without a lazy load.
+    __mapper_args__ = {"eager_defaults": True}
 
     rule_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     rule_set_name: Mapped[str] = mapped_column(String(255), nullable=False)
     keyword: Mapped[str] = mapped_column(Text, nullable=False)
@@ -248,10 +382,10 @@ class KeywordRuleORM(Base):
     language: Mapped[str | None] = mapped_column(String(10), nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now(),
     )
 
 
@@ -259,9 +393,13 @@ class AlertChannelConfigORM(Base):
     """ORM model for the ``alert_channel_configs`` table."""
 
     __tablename__ = "alert_channel_configs"
+    __table_args__ = (
+        _jsonb_gin_index("alert_channel_configs", "alert_types"),
+        _jsonb_gin_index("alert_channel_configs", "stream_ids"),
+    )
 
     channel_id: Mapped[uuid.UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid.uuid4,
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid7,
     )
     channel_type: Mapped[str] = mapped_column(CHANNEL_TYPE_ENUM, nullable=False)
     config: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False, default=dict)
@@ -270,7 +408,7 @@ class AlertChannelConfigORM(Base):
     stream_ids: Mapped[list[str] | None] = mapped_column(JSONB, nullable=True)
     enabled: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
 
 
@@ -282,7 +420,7 @@ class AuditAnchorORM(Base):
     anchor_id: Mapped[int] = mapped_column(
         BigInteger, primary_key=True, autoincrement=True,
     )
-    merkle_root: Mapped[str] = mapped_column(String(64), nullable=False)
+    merkle_root: Mapped[str] = mapped_column(Sha256Digest, nullable=False)
     segment_count: Mapped[int] = mapped_column(Integer, nullable=False)
     first_segment_id: Mapped[uuid.UUID] = mapped_column(
         PG_UUID(as_uuid=True), nullable=False,
@@ -291,5 +429,5 @@ class AuditAnchorORM(Base):
         PG_UUID(as_uuid=True), nullable=False,
     )
     anchored_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), nullable=False, default=_utc_now,
+        DateTime(timezone=True), nullable=False, server_default=func.now(),
     )
@@ -6,6 +6,6 @@ definitions shared across all services for inter-service communication
 and background job processing.
 """
 
-from tg_common.messaging.redis_client import RedisClient
+from tg_common.messaging.redis_client import RedisClient, close_pools
 
-__all__ = ["RedisClient"]
+__all__ = ["RedisClient", "close_pools"]
@@ -8,13 +8,46 @@ reconnection transparently.
 
 from __future__ import annotations
 
-import json
+from itertools import chain
 from typing import Any
 
+import orjson
 import redis.asyncio as aioredis
 
 from tg_common.config import get_settings
 
+# Process-wide connection pools keyed by URL, shared by every
+# ``RedisClient`` so connections are reused across instances.
+_POOLS: dict[str, aioredis.ConnectionPool] = {}
+
+
+def _get_pool(url: str) -> aioredis.ConnectionPool:
+    """Return the shared connection pool for *url*, creating it on first use."""
+    pool = _POOLS.get(url)
+    if pool is None:
+        pool = aioredis.ConnectionPool.from_url(
+            url,
+            max_connections=get_settings().redis_max_connections,
+            decode_responses=True,
+        )
+        _POOLS[url] = pool
+    return pool
+
+
+def _encode(message: dict[str, Any] | str) -> bytes | str:
+    """Serialise a dict payload straight to UTF-8 JSON bytes."""
+    if isinstance(message, dict):
+        return orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS)
+    return message
+
+
+async def close_pools() -> None:
+    """Disconnect and forget every shared connection pool."""
+    pools = list(_POOLS.values())
+    _POOLS.clear()
+    for pool in pools:
+        await pool.disconnect()
+
 
 class RedisClient:
     """Async Redis wrapper with publish, subscribe, xadd, and xread helpers.
@@ -31,15 +64,20 @@ class RedisClient:
     # ── lifecycle ──
 
     async def connect(self) -> None:
-        """Establish the Redis connection (idempotent)."""
+        """Establish the Redis connection (idempotent).
+
+        The client borrows connections from the process-wide pool for its
+        URL rather than opening a pool of its own.
+        """
         if self._redis is None:
-            self._redis = aioredis.from_url(
-                self._url,
-                decode_responses=True,
-            )
+            self._redis = aioredis.Redis(connection_pool=_get_pool(self._url))
 
     async def close(self) -> None:
-        """Close the Redis connection and pubsub, if open."""
+        """Close the Redis connection and pubsub, if open.
+
+        The shared connection pool stays open for other clients; see
+        :func:`close_pools`.
+        """
         if self._pubsub is not None:
             await self._pubsub.close()
             self._pubsub = None
@@ -70,8 +108,28 @@ class RedisClient:
         Returns:
             Number of subscribers that received the message.
         """
-        payload = json.dumps(message) if isinstance(message, dict) else message
-        result: int = await self.redis.publish(channel, payload)
+        result: int = await self.redis.publish(channel, _encode(message))
+        return result
+
+    async def publish_many(
+        self,
+        items: list[tuple[str, dict[str, Any] | str]],
+    ) -> list[int]:
+        """Publish several messages in one round-trip.
+
+        Args:
+            items: ``(channel, message)`` pairs; dict messages are
+                JSON-serialised as in :meth:`publish`.
+
+        Returns:
+            Subscriber counts, one per message, in order.
+        """
+        if not items:
+            return []
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for channel, message in items:
+                pipe.publish(channel, _encode(message))
+            result: list[int] = await pipe.execute()
         return result
 
     async def subscribe(self, *channels: str) -> aioredis.client.PubSub:
@@ -97,6 +155,9 @@ class RedisClient:
     ) -> str:
         """Append an entry to a Redis Stream.
 
+        The ``XADD`` command is assembled directly and sent with
+        ``execute_command``, skipping redis-py's per-call option handling.
+
         Args:
             stream: Stream key name.
             fields: Field–value mapping for the entry.
@@ -105,14 +166,43 @@ class RedisClient:
         Returns:
             The auto-generated entry ID.
         """
-        entry_id: str = await self.redis.xadd(
-            stream,
-            fields,  # type: ignore[arg-type]
-            maxlen=maxlen,
-            approximate=True if maxlen else False,
+        if maxlen:
+            head: tuple[Any, ...] = ("XADD", stream, "MAXLEN", "~", maxlen, "*")
+        else:
+            head = ("XADD", stream, "*")
+        entry_id: str = await self.redis.execute_command(
+            *head, *chain.from_iterable(fields.items()),
         )
         return entry_id
 
+    async def xadd_many(
+        self,
+        stream: str,
+        entries: list[dict[str, str]],
+        maxlen: int | None = None,
+    ) -> list[str]:
+        """Append several entries to a Redis Stream in one round-trip.
+
+        Args:
+            stream: Stream key name.
+            entries: Field–value mappings, appended in order.
+            maxlen: Optional maximum stream length (approximate trimming).
+
+        Returns:
+            The auto-generated entry IDs, one per entry, in order.
+        """
+        if not entries:
+            return []
+        if maxlen:
+            head: tuple[Any, ...] = ("XADD", stream, "MAXLEN", "~", maxlen, "*")
+        else:
+            head = ("XADD", stream, "*")
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for fields in entries:
+                pipe.execute_command(*head, *chain.from_iterable(fields.items()))
+            result: list[str] = await pipe.execute()
+        return result
+
     async def xread(
         self,
         streams: dict[str, str],
@@ -137,6 +227,64 @@ class RedisClient:
         )
         return result
 
+    async def ensure_group(self, stream: str, group: str, start_id: str = "0") -> None:
+        """Create consumer *group* on *stream* if it does not already exist.
+
+        The stream is created empty when missing.
+
+        Args:
+            stream: Stream key name.
+            group: Consumer group name.
+            start_id: First entry the group delivers (``"$"`` for only new ones).
+        """
+        try:
+            await self.redis.xgroup_create(stream, group, id=start_id, mkstream=True)
+        except aioredis.ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def xreadgroup(
+        self,
+        group: str,
+        consumer: str,
+        streams: dict[str, str],
+        count: int = 10,
+        block: int | None = None,
+    ) -> list[Any]:
+        """Read entries as *consumer* in *group*, so consumers split the work.
+
+        Unlike :meth:`xread`, each entry is delivered to one consumer of the
+        group and stays pending until acknowledged with :meth:`xack`.
+
+        Args:
+            group: Consumer group name (see :meth:`ensure_group`).
+            consumer: Name of this consumer within the group.
+            streams: Mapping of stream key → ID; ``">"`` reads never-delivered
+                     entries, ``"0"`` re-reads this consumer's pending ones.
+            count: Maximum entries to return per stream.
+            block: Milliseconds to block waiting for new data (``None`` = no block).
+
+        Returns:
+            A list of ``[stream_key, [(entry_id, fields), ...]]`` tuples.
+        """
+        result: list[Any] = await self.redis.xreadgroup(
+            group,
+            consumer,
+            streams,  # type: ignore[arg-type]
+            count=count,
+            block=block,
+        )
+        return result
+
+    async def xack(self, stream: str, group: str, *entry_ids: str) -> int:
+        """Acknowledge processed entries for *group*.
+
+        Returns:
+            Number of entries acknowledged.
+        """
+        result: int = await self.redis.xack(stream, group, *entry_ids)
+        return result
+
     # ── health check ──
 
     async def health_check(self) -> bool:
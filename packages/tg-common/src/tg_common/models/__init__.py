@@ -25,6 +25,7 @@ from tg_common.models.transcript import (
     TranscriptSegment,
     TranscriptToken,
     WordTimestamp,
+    WordTimestampBatch,
 )
 
 __all__ = [
@@ -46,4 +47,5 @@ __all__ = [
     "TranscriptSegment",
     "TranscriptToken",
     "WordTimestamp",
+    "WordTimestampBatch",
 ]
@@ -11,14 +11,16 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from functools import partial
+from typing import Annotated
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field
 
+from tg_common.utils import enum_value_lookup, uuid7
 
-def _utc_now() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+
+_utc_now = partial(datetime.now, timezone.utc)
 
 
 class AlertType(str, enum.Enum):
@@ -49,6 +51,13 @@ class MatchType(str, enum.Enum):
     INTENT = "intent"
 
 
+# Enum field types that resolve raw values with one dict lookup ahead of
+# pydantic's own enum validation.
+AlertTypeField = Annotated[AlertType, BeforeValidator(enum_value_lookup(AlertType))]
+SeverityField = Annotated[Severity, BeforeValidator(enum_value_lookup(Severity))]
+MatchTypeField = Annotated[MatchType, BeforeValidator(enum_value_lookup(MatchType))]
+
+
 # ── Intermediate event models (not persisted directly) ──
 
 
@@ -70,7 +79,7 @@ class KeywordMatchEvent(BaseModel):
     model_config = {"from_attributes": True}
 
     keyword: str = Field(..., description="Keyword or phrase that matched.")
-    match_type: MatchType = Field(..., description="Matching strategy used.")
+    match_type: MatchTypeField = Field(..., description="Matching strategy used.")
     similarity_score: float | None = Field(
         default=None,
         ge=0.0,
@@ -149,18 +158,18 @@ class Alert(BaseModel):
 
     model_config = {"from_attributes": True}
 
-    alert_id: UUID = Field(default_factory=uuid4, description="Unique identifier.")
+    alert_id: UUID = Field(default_factory=uuid7, description="Unique identifier.")
     session_id: UUID = Field(..., description="Parent session UUID.")
     stream_id: UUID = Field(..., description="Parent stream UUID.")
     segment_id: UUID | None = Field(default=None, description="Triggering segment UUID.")
-    alert_type: AlertType = Field(..., description="Alert category.")
-    severity: Severity = Field(..., description="Severity level.")
+    alert_type: AlertTypeField = Field(..., description="Alert category.")
+    severity: SeverityField = Field(..., description="Severity level.")
     matched_rule: str = Field(
         default="",
         max_length=255,
         description="Keyword/rule that triggered.",
     )
-    match_type: MatchType = Field(..., description="How it was matched.")
+    match_type: MatchTypeField = Field(..., description="How it was matched.")
     similarity_score: float | None = Field(
         default=None,
         ge=0.0,
@@ -9,21 +9,20 @@ transcript integrity and non-tampering.
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import partial
 from uuid import UUID
 
 from pydantic import BaseModel, Field
 
 
-def _utc_now() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+_utc_now = partial(datetime.now, timezone.utc)
 
 
 class AuditAnchor(BaseModel):
     """A Merkle-tree audit anchor covering a range of transcript segments.
 
     The ``audit_anchors`` table is append-only — the application role has no
-    UPDATE or DELETE permission.
+    UPDATE or DELETE permission — and instances are frozen to match.
 
     Attributes:
         anchor_id: Auto-incrementing primary key (BIGSERIAL).
@@ -34,7 +33,7 @@ class AuditAnchor(BaseModel):
         anchored_at: Timestamp when the anchor was created (UTC).
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     anchor_id: int | None = Field(
         default=None,
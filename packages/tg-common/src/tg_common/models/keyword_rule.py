@@ -10,16 +10,17 @@ from __future__ import annotations
 
 import enum
 from datetime import datetime, timezone
+from functools import partial
+from typing import Annotated
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator, Field
 
-from tg_common.models.alert import AlertType, Severity
+from tg_common.models.alert import AlertTypeField, Severity, SeverityField
+from tg_common.utils import enum_value_lookup
 
 
-def _utc_now() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+_utc_now = partial(datetime.now, timezone.utc)
 
 
 class RuleMatchType(str, enum.Enum):
@@ -42,6 +43,10 @@ class ChannelType(str, enum.Enum):
     SIGNAL = "signal"
 
 
+RuleMatchTypeField = Annotated[RuleMatchType, BeforeValidator(enum_value_lookup(RuleMatchType))]
+ChannelTypeField = Annotated[ChannelType, BeforeValidator(enum_value_lookup(ChannelType))]
+
+
 class KeywordRule(BaseModel):
     """A configurable keyword detection rule.
 
@@ -57,9 +62,12 @@ class KeywordRule(BaseModel):
         enabled: Whether this rule is active.
         created_at: Creation timestamp (UTC).
         updated_at: Last update timestamp (UTC).
+
+    Instances are frozen (and hashable); use ``model_copy(update=...)`` to
+    derive a modified rule.
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     rule_id: UUID = Field(default_factory=uuid4, description="Unique identifier.")
     rule_set_name: str = Field(
@@ -68,14 +76,14 @@ class KeywordRule(BaseModel):
         description="Logical grouping name.",
     )
     keyword: str = Field(..., description="Keyword, phrase, or regex pattern.")
-    match_type: RuleMatchType = Field(..., description="Matching mode.")
+    match_type: RuleMatchTypeField = Field(..., description="Matching mode.")
     fuzzy_threshold: float = Field(
         default=0.8,
         ge=0.0,
         le=1.0,
         description="Similarity threshold for fuzzy matching.",
     )
-    severity: Severity = Field(default=Severity.MEDIUM, description="Alert severity when matched.")
+    severity: SeverityField = Field(default=Severity.MEDIUM, description="Alert severity when matched.")
     category: str = Field(
         default="general",
         max_length=100,
@@ -109,21 +117,24 @@ class AlertChannelConfig(BaseModel):
         stream_ids: Stream UUIDs this channel is assigned to (None = all).
         enabled: Whether this channel is active.
         created_at: Creation timestamp (UTC).
+
+    Instances are frozen; use ``model_copy(update=...)`` to derive a
+    modified configuration.
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     channel_id: UUID = Field(default_factory=uuid4, description="Unique identifier.")
-    channel_type: ChannelType = Field(..., description="Channel type.")
+    channel_type: ChannelTypeField = Field(..., description="Channel type.")
     config: dict[str, str] = Field(
         default_factory=dict,
         description="Channel-specific configuration.",
     )
-    min_severity: Severity = Field(
+    min_severity: SeverityField = Field(
         default=Severity.LOW,
         description="Minimum severity to trigger.",
     )
-    alert_types: list[AlertType] = Field(
+    alert_types: list[AlertTypeField] = Field(
         default_factory=list,
         description="Alert types this channel receives.",
     )
@@ -3,16 +3,21 @@ Stream and Session data models for VoxSentinel.
 
 Defines the Pydantic models representing an audio/video stream source
 (including ASR backend, VAD threshold, and metadata) and its associated
-sessions — continuous recording periods tied to a stream.
+sessions — continuous recording periods tied to a stream.  Both are
+frozen; derive modified copies with ``model_copy(update=...)``.
 """
 
 from __future__ import annotations
 
 import enum
 from datetime import datetime, timezone
+from functools import partial
+from typing import Annotated
 from uuid import UUID, uuid4
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import AfterValidator, BaseModel, BeforeValidator, Field
+
+from tg_common.utils import enum_value_lookup
 
 
 class SourceType(str, enum.Enum):
@@ -36,9 +41,23 @@ class StreamStatus(str, enum.Enum):
     STOPPED = "stopped"
 
 
-def _utc_now() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+SourceTypeField = Annotated[SourceType, BeforeValidator(enum_value_lookup(SourceType))]
+StreamStatusField = Annotated[StreamStatus, BeforeValidator(enum_value_lookup(StreamStatus))]
+
+
+# Used as a ``default_factory`` on every construction; a partial calls the
+# C-level ``datetime.now`` directly, with no Python frame per call.
+_utc_now = partial(datetime.now, timezone.utc)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Tag a naive datetime as UTC; aware datetimes pass through."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+# Field-level validator, so only the timestamp fields pay for it rather
+# than a whole-model post-validation hook.
+UtcDatetime = Annotated[datetime, AfterValidator(_as_utc)]
 
 
 class Stream(BaseModel):
@@ -61,11 +80,11 @@ class Stream(BaseModel):
         metadata: Additional key-value metadata.
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     stream_id: UUID = Field(default_factory=uuid4, description="Unique identifier.")
     name: str = Field(..., max_length=255, description="Human-readable name.")
-    source_type: SourceType = Field(..., description="Input source type.")
+    source_type: SourceTypeField = Field(..., description="Input source type.")
     source_url: str = Field(..., description="Connection URL or file path.")
     asr_backend: str = Field(
         default="deepgram_nova2",
@@ -93,13 +112,16 @@ class Stream(BaseModel):
         gt=0,
         description="Audio chunk size in milliseconds.",
     )
-    status: StreamStatus = Field(
+    status: StreamStatusField = Field(
         default=StreamStatus.STOPPED,
         description="Current operational status.",
     )
     session_id: UUID | None = Field(default=None, description="Current active session UUID.")
-    created_at: datetime = Field(default_factory=_utc_now, description="Creation timestamp (UTC).")
-    updated_at: datetime = Field(
+    created_at: UtcDatetime = Field(
+        default_factory=_utc_now,
+        description="Creation timestamp (UTC).",
+    )
+    updated_at: UtcDatetime = Field(
         default_factory=_utc_now,
         description="Last update timestamp (UTC).",
     )
@@ -108,15 +130,6 @@ class Stream(BaseModel):
         description="Additional key-value metadata.",
     )
 
-    @model_validator(mode="after")
-    def _ensure_utc_timestamps(self) -> Stream:
-        """Ensure all timestamps carry UTC timezone info."""
-        if self.created_at.tzinfo is None:
-            self.created_at = self.created_at.replace(tzinfo=timezone.utc)
-        if self.updated_at.tzinfo is None:
-            self.updated_at = self.updated_at.replace(tzinfo=timezone.utc)
-        return self
-
 
 class Session(BaseModel):
     """A continuous recording period tied to a stream.
@@ -131,7 +144,7 @@ class Session(BaseModel):
         total_alerts: Count of alerts generated.
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     session_id: UUID = Field(default_factory=uuid4, description="Unique session identifier.")
     stream_id: UUID = Field(..., description="Parent stream UUID.")
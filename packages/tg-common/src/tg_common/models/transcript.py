@@ -3,20 +3,49 @@ Transcript data models for VoxSentinel.
 
 Defines the Pydantic models for TranscriptToken (real-time ASR output)
 and TranscriptSegment (stored finalized transcript with speaker, sentiment,
-PII redaction status, and audit hash).
+PII redaction status, and audit hash).  All models are frozen; derive
+modified copies with ``model_copy(update=...)``.
 """
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from uuid import UUID, uuid4
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime
+from typing import Annotated, Any, Literal
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    Field,
+    PlainSerializer,
+    TypeAdapter,
+    model_validator,
+)
 
+from tg_common.utils import utc_now, uuid7
 
-def _utc_now() -> datetime:
-    """Return the current UTC datetime."""
-    return datetime.now(timezone.utc)
+
+_INT32_MAX = 2**31 - 1
+
+
+def _digest_from_hex(value: Any) -> Any:
+    """Accept the hex form of a digest (as the ORM and JSON expose it)."""
+    if isinstance(value, str):
+        try:
+            return bytes.fromhex(value)
+        except ValueError as exc:
+            raise ValueError("digest must be a hex string") from exc
+    return value
+
+
+# Raw 32-byte SHA-256 digest; hex on the JSON wire.
+Sha256Bytes = Annotated[
+    bytes,
+    BeforeValidator(_digest_from_hex),
+    PlainSerializer(bytes.hex, return_type=str, when_used="json"),
+    Field(min_length=32, max_length=32),
+]
 
 
 class WordTimestamp(BaseModel):
@@ -29,7 +58,7 @@ class WordTimestamp(BaseModel):
         confidence: ASR confidence for this word (0.0–1.0).
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     word: str = Field(..., description="The transcribed word.")
     start_ms: int = Field(..., ge=0, description="Start offset in ms from session start.")
@@ -37,6 +66,127 @@ class WordTimestamp(BaseModel):
     confidence: float = Field(..., ge=0.0, le=1.0, description="ASR confidence for this word.")
 
 
+class WordTimestampBatch(BaseModel):
+    """Per-word timings for one segment, stored column-wise.
+
+    Four parallel lists replace a list of :class:`WordTimestamp` models, so
+    a segment's words validate in one pass over primitive lists instead of
+    one model per word.  Indexing and :meth:`rows` yield transient
+    :class:`WordTimestamp` views for callers that expect the row form.
+
+    Confidence is quantised to a byte (``round(confidence * 255)``) and
+    offsets are bounded to int32, which keeps the wire form compact for
+    long-retention archival; the float confidence is recovered within
+    1/510 via :attr:`confidence`.
+
+    Attributes:
+        words: Transcribed words.
+        start_ms: Start offsets in ms from session start.
+        end_ms: End offsets in ms from session start.
+        confidence_q: Quantised ASR confidence per word (0–255).
+    """
+
+    model_config = {"frozen": True}
+
+    words: list[str] = Field(default_factory=list, description="Transcribed words.")
+    start_ms: list[Annotated[int, Field(ge=0, le=_INT32_MAX)]] = Field(
+        default_factory=list,
+        description="Start offsets in ms from session start.",
+    )
+    end_ms: list[Annotated[int, Field(ge=0, le=_INT32_MAX)]] = Field(
+        default_factory=list,
+        description="End offsets in ms from session start.",
+    )
+    confidence_q: list[Annotated[int, Field(ge=0, le=255)]] = Field(
+        default_factory=list,
+        description="Quantised ASR confidence per word (0-255).",
+    )
+
+    @model_validator(mode="after")
+    def _check_lengths(self) -> WordTimestampBatch:
+        """Ensure all columns have the same length."""
+        n = len(self.words)
+        if not n == len(self.start_ms) == len(self.end_ms) == len(self.confidence_q):
+            raise ValueError("words, start_ms, end_ms and confidence_q must have equal lengths")
+        return self
+
+    @classmethod
+    def from_words(
+        cls,
+        words: Iterable[WordTimestamp | Mapping[str, Any]],
+    ) -> WordTimestampBatch:
+        """Build a batch from row-form words (models, dataclasses or dicts).
+
+        Args:
+            words: Per-word objects with ``word``, ``start_ms``, ``end_ms``
+                and ``confidence``.  Dicts may carry the quantised
+                ``confidence_q`` instead, as written by :meth:`to_records`.
+        """
+        rows = [
+            (
+                w["word"],
+                w["start_ms"],
+                w["end_ms"],
+                w["confidence_q"] if "confidence_q" in w else round(w["confidence"] * 255),
+            )
+            if isinstance(w, Mapping)
+            else (w.word, w.start_ms, w.end_ms, round(w.confidence * 255))
+            for w in words
+        ]
+        if not rows:
+            return cls()
+        text, start, end, confidence_q = zip(*rows)
+        return cls(
+            words=list(text),
+            start_ms=list(start),
+            end_ms=list(end),
+            confidence_q=list(confidence_q),
+        )
+
+    @property
+    def confidence(self) -> list[float]:
+        """ASR confidence per word, dequantised to 0.0–1.0."""
+        return [q / 255 for q in self.confidence_q]
+
+    def rows(self) -> Iterator[WordTimestamp]:
+        """Yield the words in row form as :class:`WordTimestamp` views."""
+        for i in range(len(self.words)):
+            yield self[i]
+
+    def to_records(self) -> list[dict[str, Any]]:
+        """Return the words as plain dicts for JSONB archival.
+
+        Confidence stays quantised (``confidence_q``); a dequantised float
+        would be both lossy and longer.  :meth:`from_words` reads the
+        records back.
+        """
+        return [
+            {"word": w, "start_ms": s, "end_ms": e, "confidence_q": q}
+            for w, s, e, q in zip(self.words, self.start_ms, self.end_ms, self.confidence_q)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def __getitem__(self, index: int) -> WordTimestamp:
+        return WordTimestamp.model_construct(
+            word=self.words[index],
+            start_ms=self.start_ms[index],
+            end_ms=self.end_ms[index],
+            confidence=self.confidence_q[index] / 255,
+        )
+
+
+def _as_word_batch(value: Any) -> Any:
+    """Accept the row-form list of words for ``word_timestamps``."""
+    if isinstance(value, list):
+        try:
+            return WordTimestampBatch.from_words(value)
+        except (KeyError, AttributeError, TypeError) as exc:
+            raise ValueError(f"malformed word timestamp: {exc}") from exc
+    return value
+
+
 class TranscriptToken(BaseModel):
     """A real-time transcript token emitted by the ASR engine.
 
@@ -53,7 +203,7 @@ class TranscriptToken(BaseModel):
         word_timestamps: Per-word timing and confidence list.
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
     text: str = Field(..., description="Transcribed text for this token.")
     is_final: bool = Field(default=False, description="Whether this is a finalized token.")
@@ -81,7 +231,8 @@ class TranscriptSegment(BaseModel):
         end_offset_ms: Offset in ms from session start.
         text_redacted: PII-redacted transcript text.
         text_original: Original transcript text (restricted access).
-        word_timestamps: Array of per-word timing objects.
+        word_timestamps: Per-word timings, stored column-wise (a row-form
+            list of words is accepted on input).
         language: Detected language code.
         asr_backend: ASR engine used.
         asr_confidence: Overall confidence score.
@@ -89,13 +240,14 @@ class TranscriptSegment(BaseModel):
         sentiment_score: Sentiment confidence score.
         intent_labels: Detected intent labels.
         pii_entities_found: PII entity types detected before redaction.
-        segment_hash: SHA-256 audit hash.
+        segment_hash: SHA-256 audit hash as 32 raw bytes (hex strings are
+            accepted on input and emitted in JSON).
         created_at: Storage timestamp (UTC).
     """
 
-    model_config = {"from_attributes": True}
+    model_config = {"from_attributes": True, "frozen": True}
 
-    segment_id: UUID = Field(default_factory=uuid4, description="Unique identifier.")
+    segment_id: UUID = Field(default_factory=uuid7, description="Unique identifier.")
     session_id: UUID = Field(..., description="Parent session UUID.")
     stream_id: UUID = Field(..., description="Parent stream UUID.")
     speaker_id: str | None = Field(
@@ -112,9 +264,9 @@ class TranscriptSegment(BaseModel):
         default=None,
         description="Original transcript text (restricted access).",
     )
-    word_timestamps: list[WordTimestamp] = Field(
-        default_factory=list,
-        description="Per-word timing objects.",
+    word_timestamps: Annotated[WordTimestampBatch, BeforeValidator(_as_word_batch)] = Field(
+        default_factory=WordTimestampBatch,
+        description="Per-word timings, stored column-wise.",
     )
     language: str = Field(default="en", max_length=10, description="Detected language code.")
     asr_backend: str = Field(
@@ -128,10 +280,9 @@ class TranscriptSegment(BaseModel):
         le=1.0,
         description="Overall confidence score.",
     )
-    sentiment_label: str | None = Field(
+    sentiment_label: Literal["positive", "neutral", "negative"] | None = Field(
         default=None,
-        max_length=20,
-        description="Sentiment classification (positive/neutral/negative).",
+        description="Sentiment classification; matches ``sentiment_label_enum``.",
     )
     sentiment_score: float | None = Field(
         default=None,
@@ -147,12 +298,23 @@ class TranscriptSegment(BaseModel):
         default_factory=list,
         description="PII entity types detected before redaction.",
     )
-    segment_hash: str | None = Field(
+    segment_hash: Sha256Bytes | None = Field(
         default=None,
-        max_length=64,
-        description="SHA-256 audit hash.",
+        description="SHA-256 audit hash (raw digest; hex in JSON).",
     )
     created_at: datetime = Field(
-        default_factory=_utc_now,
+        default_factory=utc_now,
         description="Storage timestamp (UTC).",
     )
+
+
+# Bound JSON validators and serialisers for hot consumers and publishers:
+# raw ``str``/``bytes`` payloads are parsed straight into models (with no
+# intermediate dict) and models are dumped straight to ``bytes`` by
+# pydantic-core.
+_SEGMENT_ADAPTER = TypeAdapter(TranscriptSegment)
+_TOKEN_ADAPTER = TypeAdapter(TranscriptToken)
+validate_segment_json = _SEGMENT_ADAPTER.validate_json
+validate_token_json = _TOKEN_ADAPTER.validate_json
+dump_segment_json = _SEGMENT_ADAPTER.dump_json
+dump_token_json = _TOKEN_ADAPTER.dump_json
@@ -0,0 +1,132 @@
+"""
+Slotted dataclass transcript types for VoxSentinel hot paths.
+
+ASR backends emit thousands of tokens per minute per stream; building
+them as Pydantic models pays for a full validation pass on data the
+backend has just produced itself.  The dataclasses here mirror the
+fields of :mod:`tg_common.models.transcript` without validation and are
+constructed directly by internal producers.  Convert to the Pydantic
+models with :meth:`to_model` (or parse untrusted input with
+:meth:`validate`) at REST/IPC boundaries.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+import orjson
+
+from tg_common.models import transcript
+from tg_common.utils import utc_now, uuid7
+
+
+@dataclass(slots=True)
+class WordTimestamp:
+    """A single word with its timing and confidence from ASR output.
+
+    See :class:`tg_common.models.transcript.WordTimestamp`.
+    """
+
+    word: str
+    start_ms: int
+    end_ms: int
+    confidence: float
+
+    @classmethod
+    def validate(cls, data: dict[str, Any]) -> WordTimestamp:
+        """Build an instance from untrusted *data*, validating it first.
+
+        Raises:
+            pydantic.ValidationError: If *data* fails model validation.
+        """
+        return cls(**transcript.WordTimestamp.model_validate(data).model_dump())
+
+    def to_model(self) -> transcript.WordTimestamp:
+        """Return the equivalent Pydantic model."""
+        return transcript.WordTimestamp.model_validate(asdict(self))
+
+
+@dataclass(slots=True)
+class TranscriptToken:
+    """A real-time transcript token emitted by an ASR engine.
+
+    See :class:`tg_common.models.transcript.TranscriptToken`.
+    """
+
+    text: str
+    start_time: datetime
+    end_time: datetime
+    confidence: float
+    is_final: bool = False
+    language: str = "en"
+    word_timestamps: list[WordTimestamp] = field(default_factory=list)
+
+    @classmethod
+    def validate(cls, data: dict[str, Any]) -> TranscriptToken:
+        """Build an instance from untrusted *data*, validating it first.
+
+        Raises:
+            pydantic.ValidationError: If *data* fails model validation.
+        """
+        values = transcript.TranscriptToken.model_validate(data).model_dump()
+        values["word_timestamps"] = [WordTimestamp(**w) for w in values["word_timestamps"]]
+        return cls(**values)
+
+    def to_model(self) -> transcript.TranscriptToken:
+        """Return the equivalent Pydantic model."""
+        return transcript.TranscriptToken.model_validate(asdict(self))
+
+    def to_json(self) -> str:
+        """Serialise to JSON accepted by ``TranscriptToken.model_validate_json``."""
+        return orjson.dumps(self).decode()
+
+
+@dataclass(slots=True)
+class TranscriptSegment:
+    """A finalized transcript segment with full metadata.
+
+    See :class:`tg_common.models.transcript.TranscriptSegment`.
+    """
+
+    session_id: UUID
+    stream_id: UUID
+    start_time: datetime
+    end_time: datetime
+    segment_id: UUID = field(default_factory=uuid7)
+    speaker_id: str | None = None
+    start_offset_ms: int = 0
+    end_offset_ms: int = 0
+    text_redacted: str = ""
+    text_original: str | None = None
+    word_timestamps: list[WordTimestamp] = field(default_factory=list)
+    language: str = "en"
+    asr_backend: str = "deepgram_nova2"
+    asr_confidence: float = 0.0
+    sentiment_label: str | None = None
+    sentiment_score: float | None = None
+    intent_labels: list[str] = field(default_factory=list)
+    pii_entities_found: list[str] = field(default_factory=list)
+    segment_hash: bytes | None = None
+    created_at: datetime = field(default_factory=utc_now)
+
+    @classmethod
+    def validate(cls, data: dict[str, Any]) -> TranscriptSegment:
+        """Build an instance from untrusted *data*, validating it first.
+
+        Raises:
+            pydantic.ValidationError: If *data* fails model validation.
+        """
+        model = transcript.TranscriptSegment.model_validate(data)
+        values = model.model_dump(exclude={"word_timestamps"})
+        values["word_timestamps"] = [
+            WordTimestamp(w.word, w.start_ms, w.end_ms, w.confidence)
+            for w in model.word_timestamps.rows()
+        ]
+        return cls(**values)
+
+    def to_model(self) -> transcript.TranscriptSegment:
+        """Return the equivalent Pydantic model."""
+        return transcript.TranscriptSegment.model_validate(asdict(self))
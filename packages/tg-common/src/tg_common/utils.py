@@ -7,3 +7,57 @@ data transformations.
 """
 
 from __future__ import annotations
+
+import enum
+import os
+import time
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+
+def uuid7() -> uuid.UUID:
+    """Return a time-ordered UUID version 7 (RFC 9562).
+
+    The leading 48 bits hold the Unix timestamp in milliseconds, so new
+    identifiers sort after older ones and inserts land on the right-hand
+    edge of B-tree primary-key indexes instead of random leaf pages.
+
+    Returns:
+        A new ``uuid.UUID`` with version 7 and the RFC 4122 variant.
+    """
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
+
+
+def utc_now() -> datetime:
+    """Return the current time as a timezone-aware UTC ``datetime``."""
+    return datetime.now(timezone.utc)
+
+
+def enum_value_lookup(enum_cls: type[enum.Enum]) -> Callable[[Any], Any]:
+    """Return a callable that maps an enum value to its member.
+
+    Intended as a Pydantic ``BeforeValidator``: a single ``dict.get`` on the
+    enum's value map hands the field validator a ready member, which it
+    accepts directly instead of running its own value lookup.  Unknown or
+    unhashable inputs are passed through unchanged for normal validation.
+
+    Args:
+        enum_cls: Enum class whose values are looked up.
+
+    Returns:
+        A callable taking a raw value and returning the member or the value.
+    """
+    members = enum_cls._value2member_map_
+
+    def lookup(value: Any) -> Any:
+        try:
+            return members.get(value, value)
+        except TypeError:
+            return value
+
+    return lookup
@@ -0,0 +1,172 @@
+"""
+Tests for tg-common bulk write helpers.
+
+Validates the small-batch ORM fallback and the COPY path's record
+encoding using a mocked asyncpg driver connection.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects.postgresql.asyncpg import dialect as asyncpg_dialect
+
+from tg_common.db import bulk
+from tg_common.db.orm_models import AlertORM, TranscriptSegmentORM
+
+
+def _segment(**overrides: object) -> TranscriptSegmentORM:
+    now = datetime.now(timezone.utc)
+    fields: dict[str, object] = {
+        "session_id": uuid.uuid4(),
+        "stream_id": uuid.uuid4(),
+        "start_time": now,
+        "end_time": now,
+    }
+    fields.update(overrides)
+    return TranscriptSegmentORM(**fields)
+
+
+def _alert() -> AlertORM:
+    return AlertORM(
+        session_id=uuid.uuid4(),
+        stream_id=uuid.uuid4(),
+        alert_type="keyword",
+        severity="high",
+        match_type="exact",
+    )
+
+
+@pytest.fixture()
+def session() -> MagicMock:
+    """Return a mocked ``AsyncSession`` whose raw connection supports COPY."""
+    driver = AsyncMock()
+    raw = MagicMock()
+    raw.driver_connection = driver
+    conn = MagicMock()
+    conn.dialect = asyncpg_dialect()
+    conn.get_raw_connection = AsyncMock(return_value=raw)
+    s = MagicMock()
+    s.flush = AsyncMock()
+    s.connection = AsyncMock(return_value=conn)
+    s.driver = driver
+    return s
+
+
+class TestBulkInsertSegments:
+
+    @pytest.mark.asyncio
+    async def test_small_batch_uses_orm(self, session: MagicMock) -> None:
+        rows = [_segment() for _ in range(3)]
+        assert await bulk.bulk_insert_segments(session, rows) == 3
+        session.add_all.assert_called_once_with(rows)
+        session.driver.copy_records_to_table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_copy(self, session: MagicMock) -> None:
+        rows = [_segment(intent_labels=["fraud"]) for _ in range(bulk.COPY_THRESHOLD)]
+        assert await bulk.bulk_insert_segments(session, rows) == bulk.COPY_THRESHOLD
+        session.add_all.assert_not_called()
+        session.flush.assert_awaited_once()
+        call = session.driver.copy_records_to_table.await_args
+        assert call.args == ("transcript_segments",)
+        columns = call.kwargs["columns"]
+        records = call.kwargs["records"]
+        assert len(records) == bulk.COPY_THRESHOLD
+        record = dict(zip(columns, records[0]))
+        # Python-side defaults are applied and written back to the instance.
+        assert record["segment_id"] == rows[0].segment_id is not None
+        assert record["language"] == "en"
+        # Server-default timestamps are left for PostgreSQL to fill in.
+        assert "created_at" not in columns
+        # JSONB is encoded the same way the ORM would bind it.
+        assert record["intent_labels"] == '["fraud"]'
+
+    @pytest.mark.asyncio
+    async def test_segment_hash_encoded_as_bytes(self, session: MagicMock) -> None:
+        rows = [_segment(segment_hash="ab" * 32) for _ in range(bulk.COPY_THRESHOLD)]
+        await bulk.bulk_insert_segments(session, rows)
+        call = session.driver.copy_records_to_table.await_args
+        record = dict(zip(call.kwargs["columns"], call.kwargs["records"][0]))
+        assert record["segment_hash"] == bytes.fromhex("ab" * 32)
+
+    @pytest.mark.asyncio
+    async def test_explicit_server_default_is_copied(self, session: MagicMock) -> None:
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        rows = [_segment() for _ in range(bulk.COPY_THRESHOLD)]
+        rows[0].created_at = ts
+        await bulk.bulk_insert_segments(session, rows)
+        calls = session.driver.copy_records_to_table.await_args_list
+        assert len(calls) == 2
+        with_ts = next(c for c in calls if "created_at" in c.kwargs["columns"])
+        assert len(with_ts.kwargs["records"]) == 1
+        record = dict(zip(with_ts.kwargs["columns"], with_ts.kwargs["records"][0]))
+        assert record["created_at"] == ts
+
+
+class TestBulkInsertAlerts:
+
+    @pytest.mark.asyncio
+    async def test_small_batch_uses_orm(self, session: MagicMock) -> None:
+        rows = [_alert()]
+        await bulk.bulk_insert_alerts(session, rows)
+        session.add_all.assert_called_once_with(rows)
+
+    @pytest.mark.asyncio
+    async def test_large_batch_uses_copy(self, session: MagicMock) -> None:
+        rows = [_alert() for _ in range(bulk.COPY_THRESHOLD)]
+        await bulk.bulk_insert_alerts(session, rows)
+        call = session.driver.copy_records_to_table.await_args
+        assert call.args == ("alerts",)
+        record = dict(zip(call.kwargs["columns"], call.kwargs["records"][0]))
+        assert record["severity"] == "high"
+        assert record["deduplicated"] is False
+
+
+class TestBulkInsertColumns:
+
+    def test_append_rejects_unknown_column(self) -> None:
+        batch = bulk.ColumnBatch(TranscriptSegmentORM)
+        with pytest.raises(TypeError, match="bogus"):
+            batch.append(bogus=1)
+
+    @pytest.mark.asyncio
+    async def test_empty_batch_is_noop(self, session: MagicMock) -> None:
+        batch = bulk.ColumnBatch(AlertORM)
+        assert await bulk.bulk_insert_columns(session, batch) == 0
+        session.driver.copy_records_to_table.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copies_columns_with_defaults(self, session: MagicMock) -> None:
+        batch = bulk.ColumnBatch(TranscriptSegmentORM)
+        now = datetime.now(timezone.utc)
+        for _ in range(3):
+            batch.append(
+                session_id=uuid.uuid4(),
+                stream_id=uuid.uuid4(),
+                start_time=now,
+                end_time=now,
+                segment_hash="cd" * 32,
+            )
+        assert await bulk.bulk_insert_columns(session, batch) == 3
+        call = session.driver.copy_records_to_table.await_args
+        assert call.args == ("transcript_segments",)
+        columns = call.kwargs["columns"]
+        assert "created_at" not in columns
+        record = dict(zip(columns, call.kwargs["records"][0]))
+        # Generated IDs are written back to the batch.
+        assert record["segment_id"] == batch.columns["segment_id"][0] is not None
+        assert record["language"] == "en"
+        assert record["segment_hash"] == bytes.fromhex("cd" * 32)
+        assert record["intent_labels"] is None
+
+    @pytest.mark.asyncio
+    async def test_partial_server_default_rejected(self, session: MagicMock) -> None:
+        batch = bulk.ColumnBatch(AlertORM)
+        batch.append(created_at=datetime.now(timezone.utc))
+        batch.append()
+        with pytest.raises(ValueError, match="created_at"):
+            await bulk.bulk_insert_columns(session, batch)
@@ -7,6 +7,7 @@ and validation constraints work correctly via pydantic-settings.
 
 from __future__ import annotations
 
+import functools
 import os
 from unittest.mock import patch
 
@@ -21,7 +22,7 @@ from tg_common.config import Settings, get_settings
 # ---------------------------------------------------------------------------
 
 def _clear_settings_cache() -> None:
-    """Reset the ``get_settings`` lru_cache between tests."""
+    """Reset the ``get_settings`` cache between tests."""
     get_settings.cache_clear()
 
 
@@ -34,8 +35,12 @@ class TestSettingsDefaults:
     """Verify that ``Settings`` populates sane defaults when no env vars are set."""
 
     @staticmethod
+    @functools.cache
     def _clean_env():
-        """Remove TG_ env vars so Settings reads only hardcoded defaults."""
+        """Remove TG_ env vars so Settings reads only hardcoded defaults.
+
+        Computed once per run; ``patch.dict`` only reads the mapping.
+        """
         return {k: v for k, v in os.environ.items() if not k.startswith("TG_")}
 
     def test_default_db_uri(self) -> None:
@@ -47,6 +52,14 @@ class TestSettingsDefaults:
         with patch.dict(os.environ, self._clean_env(), clear=True):
             assert Settings().db_pool_size == 10
 
+    def test_default_db_pool_tuning(self) -> None:
+        with patch.dict(os.environ, self._clean_env(), clear=True):
+            s = Settings()
+        assert s.db_max_overflow == 20
+        assert s.db_pool_recycle == 1800
+        assert s.db_pool_pre_ping is True
+        assert s.db_pool_timeout == 30
+
     def test_default_redis_url(self) -> None:
         with patch.dict(os.environ, self._clean_env(), clear=True):
             assert Settings().redis_url == "redis://localhost:6379/0"
@@ -130,6 +143,15 @@ class TestSettingsValidation:
         with pytest.raises(ValidationError):
             Settings(retention_days=-5)  # type: ignore[call-arg]
 
+    def test_frozen(self) -> None:
+        s = Settings()
+        with pytest.raises(ValidationError):
+            s.log_level = "DEBUG"  # type: ignore[misc]
+
+    def test_hashable(self) -> None:
+        s = Settings()
+        assert hash(s) == hash(s)
+
 
 # ---------------------------------------------------------------------------
 # Tests: get_settings singleton
@@ -153,3 +175,9 @@ class TestGetSettings:
         a = get_settings()
         b = get_settings()
         assert a is b
+
+    def test_validator_compiled_at_import(self) -> None:
+        # Schema build happens at class definition, not on the first
+        # ``get_settings()`` call, so workers do not pay it per request.
+        assert Settings.__pydantic_complete__
+        assert not Settings.model_config.get("defer_build", False)
@@ -0,0 +1,160 @@
+"""
+Tests for tg-common database connection helpers.
+
+Validates engine and pool configuration produced by ``build_engine`` and
+the shared-engine lifecycle helpers without opening a real database
+connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+
+from tg_common.db import connection
+from tg_common.db.connection import build_engine, build_health_engine
+
+
+# ---------------------------------------------------------------------------
+# Tests: build_engine
+# ---------------------------------------------------------------------------
+
+
+class TestBuildEngine:
+
+    def test_uses_async_adapted_queue_pool(self) -> None:
+        engine = build_engine()
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+
+    def test_pool_sizing_from_settings(self) -> None:
+        engine = build_engine()
+        assert engine.pool.size() == 10
+        assert engine.pool._max_overflow == 20  # type: ignore[attr-defined]
+
+    def test_pool_sizing_overrides(self) -> None:
+        engine = build_engine(pool_size=4, max_overflow=0)
+        assert engine.pool.size() == 4
+        assert engine.pool._max_overflow == 0  # type: ignore[attr-defined]
+
+    def test_statement_cache_settings_passed(self) -> None:
+        with patch.object(connection, "create_async_engine") as mock_create:
+            build_engine()
+        kwargs = mock_create.call_args.kwargs
+        assert kwargs["query_cache_size"] == 1200
+        assert kwargs["connect_args"] == {
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 512,
+        }
+
+    def test_session_factory_memoised_per_engine(self) -> None:
+        engine = build_engine()
+        assert connection.build_session_factory(engine) is connection.build_session_factory(engine)
+
+    def test_health_engine_uses_null_pool(self) -> None:
+        engine = build_health_engine()
+        assert isinstance(engine.pool, NullPool)
+
+
+# ---------------------------------------------------------------------------
+# Tests: shared engine lifecycle
+# ---------------------------------------------------------------------------
+
+
+class TestInitEngine:
+
+    def teardown_method(self) -> None:
+        connection._engine = None
+        connection._session_factory = None
+        connection._health_engine = None
+
+    def test_get_engine_requires_init(self) -> None:
+        with pytest.raises(RuntimeError):
+            connection.get_engine()
+
+    def test_get_session_factory_requires_init(self) -> None:
+        with pytest.raises(RuntimeError):
+            connection.get_session_factory()
+
+    @pytest.mark.asyncio
+    async def test_init_prewarms_pool(self) -> None:
+        engine = MagicMock()
+        engine.pool.size.return_value = 3
+        conn = AsyncMock()
+        engine.connect = MagicMock(side_effect=lambda: _ready(conn))
+        with patch.object(connection, "build_engine", return_value=engine):
+            result = await connection.init_engine()
+        assert result is engine
+        assert connection.get_engine() is engine
+        assert engine.connect.call_count == 3
+        assert conn.close.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_init_tolerates_unreachable_db(self) -> None:
+        engine = MagicMock()
+        engine.pool.size.return_value = 2
+        engine.connect = MagicMock(side_effect=lambda: _fail(OSError("refused")))
+        with patch.object(connection, "build_engine", return_value=engine):
+            await connection.init_engine()
+        assert connection.get_session_factory() is not None
+
+    @pytest.mark.asyncio
+    async def test_dispose_resets_state(self) -> None:
+        engine = AsyncMock()
+        connection._engine = engine
+        await connection.dispose_engine()
+        engine.dispose.assert_awaited_once()
+        assert connection._engine is None
+
+
+# ---------------------------------------------------------------------------
+# Tests: check_database_health
+# ---------------------------------------------------------------------------
+
+
+class TestCheckDatabaseHealth:
+
+    def teardown_method(self) -> None:
+        connection._health_engine = None
+
+    @pytest.mark.asyncio
+    async def test_healthy_reuses_precompiled_statement(self) -> None:
+        conn = AsyncMock()
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+        connection._health_engine = engine
+        assert await connection.check_database_health() is True
+        conn.scalar.assert_awaited_once_with(connection._HEALTH_STMT)
+
+    @pytest.mark.asyncio
+    async def test_unhealthy_returns_false(self) -> None:
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.side_effect = OSError("refused")
+        connection._health_engine = engine
+        assert await connection.check_database_health() is False
+
+    @pytest.mark.asyncio
+    async def test_slow_database_times_out(self) -> None:
+        async def _hang(*_args: object) -> None:
+            await asyncio.sleep(10)
+
+        conn = AsyncMock()
+        conn.scalar = _hang
+        engine = MagicMock()
+        engine.connect.return_value.__aenter__.return_value = conn
+        connection._health_engine = engine
+        assert await connection.check_database_health(timeout=0.01) is False
+
+    @pytest.mark.asyncio
+    async def test_not_initialised_returns_false(self) -> None:
+        assert await connection.check_database_health() is False
+
+
+async def _ready(value: object) -> object:
+    return value
+
+
+async def _fail(exc: BaseException) -> None:
+    raise exc
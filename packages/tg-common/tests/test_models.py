@@ -28,10 +28,14 @@ from tg_common.models.keyword_rule import (
     RuleMatchType,
 )
 from tg_common.models.stream import Session, SourceType, Stream, StreamStatus
+from tg_common.models import transcript_fast
 from tg_common.models.transcript import (
     TranscriptSegment,
     TranscriptToken,
     WordTimestamp,
+    WordTimestampBatch,
+    dump_segment_json,
+    validate_segment_json,
 )
 
 
@@ -85,6 +89,17 @@ class TestStream:
         s = Stream(name="s", source_type="file", source_url="f.wav", metadata={"k": "v"})
         assert s.metadata == {"k": "v"}
 
+    def test_naive_timestamps_tagged_utc(self) -> None:
+        s = Stream(
+            name="s",
+            source_type="rtsp",
+            source_url="x",
+            created_at="2025-01-01T12:00:00",
+            updated_at=datetime(2025, 1, 1, 12, 0),
+        )
+        assert s.created_at == datetime(2025, 1, 1, 12, 0, tzinfo=timezone.utc)
+        assert s.updated_at.tzinfo is timezone.utc
+
 
 # ===========================================================================
 # Session model tests
@@ -152,6 +167,36 @@ class TestTranscriptSegment:
         assert len(seg.word_timestamps) == 1
         assert seg.word_timestamps[0].word == "hi"
 
+    def test_segment_hash_raw_bytes_hex_in_json(self) -> None:
+        digest = bytes(range(32))
+        seg = self._make(segment_hash=digest.hex())
+        assert seg.segment_hash == digest
+        assert seg.model_dump(mode="json")["segment_hash"] == digest.hex()
+        assert TranscriptSegment.model_validate_json(seg.model_dump_json()) == seg
+
+    def test_segment_hash_wrong_length_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            self._make(segment_hash=b"\x00" * 31)
+        with pytest.raises(ValidationError):
+            self._make(segment_hash="zz" * 32)
+
+    def test_sentiment_label_limited_to_enum(self) -> None:
+        assert self._make(sentiment_label="negative").sentiment_label == "negative"
+        with pytest.raises(ValidationError):
+            self._make(sentiment_label="label_1")
+
+    def test_bound_json_adapters_round_trip(self) -> None:
+        seg = self._make()
+        raw = dump_segment_json(seg)
+        assert isinstance(raw, bytes)
+        assert validate_segment_json(raw) == seg
+
+    def test_frozen(self) -> None:
+        seg = self._make()
+        with pytest.raises(ValidationError):
+            seg.text_redacted = "changed"  # type: ignore[misc]
+        assert seg.model_copy(update={"text_redacted": "changed"}).text_redacted == "changed"
+
 
 class TestWordTimestamp:
 
@@ -164,6 +209,52 @@ class TestWordTimestamp:
             WordTimestamp(start_ms=0, end_ms=100, confidence=0.9)  # type: ignore[call-arg]
 
 
+class TestWordTimestampBatch:
+
+    def test_segment_accepts_row_form(self) -> None:
+        seg = TestTranscriptSegment()._make(
+            word_timestamps=[
+                {"word": "hi", "start_ms": 0, "end_ms": 100, "confidence": 0.9},
+                WordTimestamp(word="there", start_ms=100, end_ms=250, confidence=0.8),
+            ],
+        )
+        batch = seg.word_timestamps
+        assert batch.words == ["hi", "there"]
+        assert batch.end_ms == [100, 250]
+        assert [w.word for w in batch.rows()] == ["hi", "there"]
+        assert dict(batch)["words"] == ["hi", "there"]
+        assert batch.confidence_q == [230, 204]
+        assert batch.to_records()[1] == {
+            "word": "there", "start_ms": 100, "end_ms": 250, "confidence_q": 204,
+        }
+        assert WordTimestampBatch.from_words(batch.to_records()) == batch
+        assert batch[0].confidence == pytest.approx(0.9, abs=1 / 510)
+
+    def test_columnar_json_round_trip(self) -> None:
+        seg = TestTranscriptSegment()._make(
+            word_timestamps=WordTimestampBatch(
+                words=["a"], start_ms=[0], end_ms=[5], confidence_q=[128],
+            ),
+        )
+        assert TranscriptSegment.model_validate_json(seg.model_dump_json()) == seg
+
+    def test_length_mismatch_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            WordTimestampBatch(words=["a", "b"], start_ms=[0], end_ms=[5], confidence_q=[128])
+
+    def test_out_of_range_values_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            WordTimestampBatch.from_words(
+                [{"word": "a", "start_ms": 0, "end_ms": 5, "confidence": 1.5}],
+            )
+        with pytest.raises(ValidationError):
+            WordTimestampBatch(words=["a"], start_ms=[0], end_ms=[2**31], confidence_q=[0])
+
+    def test_malformed_row_rejected(self) -> None:
+        with pytest.raises(ValidationError):
+            TestTranscriptSegment()._make(word_timestamps=[{"word": "a"}])
+
+
 class TestTranscriptToken:
 
     def test_valid(self) -> None:
@@ -182,6 +273,42 @@ class TestTranscriptToken:
         assert t.word_timestamps == []
 
 
+class TestTranscriptFast:
+
+    def _token(self) -> transcript_fast.TranscriptToken:
+        return transcript_fast.TranscriptToken(
+            text="hi there", start_time=_NOW, end_time=_NOW, confidence=0.9,
+            word_timestamps=[transcript_fast.WordTimestamp("hi", 0, 100, 0.9)],
+        )
+
+    def test_slotted(self) -> None:
+        assert not hasattr(self._token(), "__dict__")
+
+    def test_to_model_round_trip(self) -> None:
+        model = self._token().to_model()
+        assert isinstance(model, TranscriptToken)
+        assert model.word_timestamps[0] == WordTimestamp(
+            word="hi", start_ms=0, end_ms=100, confidence=0.9,
+        )
+
+    def test_json_parses_as_model(self) -> None:
+        token = self._token()
+        assert TranscriptToken.model_validate_json(token.to_json()) == token.to_model()
+
+    def test_validate_rejects_bad_input(self) -> None:
+        with pytest.raises(ValidationError):
+            transcript_fast.TranscriptToken.validate(
+                {"text": "x", "start_time": _NOW, "end_time": _NOW, "confidence": 2.0},
+            )
+
+    def test_segment_validate_builds_dataclass(self) -> None:
+        seg = transcript_fast.TranscriptSegment.validate(
+            {"session_id": str(_UUID), "stream_id": _UUID, "start_time": _NOW, "end_time": _NOW},
+        )
+        assert seg.session_id == _UUID
+        assert seg.to_model().segment_id == seg.segment_id
+
+
 # ===========================================================================
 # Alert model tests
 # ===========================================================================
@@ -292,6 +419,13 @@ class TestKeywordRule:
             r = KeywordRule(rule_set_name="s", keyword="k", match_type=mt.value)
             assert r.match_type == mt
 
+    def test_frozen_and_hashable(self) -> None:
+        r = KeywordRule(rule_set_name="s", keyword="k", match_type="exact")
+        with pytest.raises(ValidationError):
+            r.enabled = False  # type: ignore[misc]
+        assert hash(r) == hash(r.model_copy())
+        assert r.model_copy(update={"enabled": False}).enabled is False
+
 
 class TestAlertChannelConfig:
 
@@ -372,3 +506,43 @@ class TestEnums:
 
     def test_channel_type_completeness(self) -> None:
         assert len(ChannelType) == 7
+
+
+# ===========================================================================
+# ORM column type tests
+# ===========================================================================
+
+
+class TestSha256Digest:
+
+    def test_round_trip(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        from tg_common.db.orm_models import Sha256Digest
+
+        col = Sha256Digest()
+        dialect = postgresql.dialect()
+        digest = "ab" * 32
+        raw = col.process_bind_param(digest, dialect)
+        assert raw == bytes.fromhex(digest)
+        assert len(raw) == 32
+        assert col.process_result_value(raw, dialect) == digest
+
+    def test_none_passthrough(self) -> None:
+        from sqlalchemy.dialects import postgresql
+
+        from tg_common.db.orm_models import Sha256Digest
+
+        col = Sha256Digest()
+        assert col.process_bind_param(None, postgresql.dialect()) is None
+        assert col.process_result_value(None, postgresql.dialect()) is None
+
+
+class TestRelationshipLoading:
+
+    def test_relationships_raise_on_lazy_load(self) -> None:
+        from tg_common.db.orm_models import Base
+
+        for mapper in Base.registry.mappers:
+            for rel in mapper.relationships:
+                assert rel.lazy == "raise_on_sql", f"{mapper.class_.__name__}.{rel.key}"
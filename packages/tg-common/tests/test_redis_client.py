@@ -7,10 +7,13 @@ covering connect, close, publish, subscribe, xadd, xread, and health_check.
 
 from __future__ import annotations
 
+import json
+import uuid
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from tg_common.messaging import redis_client
 from tg_common.messaging.redis_client import RedisClient
 
 
@@ -25,7 +28,7 @@ def mock_redis() -> AsyncMock:
     r = AsyncMock()
     r.publish = AsyncMock(return_value=1)
     r.ping = AsyncMock(return_value=True)
-    r.xadd = AsyncMock(return_value="1234567890-0")
+    r.execute_command = AsyncMock(return_value="1234567890-0")
     r.xread = AsyncMock(return_value=[])
     r.close = AsyncMock()
     # pubsub mock
@@ -51,23 +54,54 @@ def client(mock_redis: AsyncMock) -> RedisClient:
 
 class TestLifecycle:
 
+    def teardown_method(self) -> None:
+        redis_client._POOLS.clear()
+
     @pytest.mark.asyncio
     async def test_connect_creates_redis(self) -> None:
-        with patch("tg_common.messaging.redis_client.aioredis.from_url") as mock_from:
-            mock_from.return_value = AsyncMock()
+        with (
+            patch.object(redis_client.aioredis, "ConnectionPool") as mock_pool,
+            patch.object(redis_client.aioredis, "Redis") as mock_cls,
+        ):
             c = RedisClient(url="redis://localhost:6379/0")
             await c.connect()
-            mock_from.assert_called_once()
-            assert c._redis is not None
+        mock_pool.from_url.assert_called_once_with(
+            "redis://localhost:6379/0", max_connections=64, decode_responses=True,
+        )
+        mock_cls.assert_called_once_with(connection_pool=mock_pool.from_url.return_value)
+        assert c._redis is mock_cls.return_value
 
     @pytest.mark.asyncio
     async def test_connect_idempotent(self) -> None:
-        with patch("tg_common.messaging.redis_client.aioredis.from_url") as mock_from:
-            mock_from.return_value = AsyncMock()
+        with (
+            patch.object(redis_client.aioredis, "ConnectionPool"),
+            patch.object(redis_client.aioredis, "Redis") as mock_cls,
+        ):
             c = RedisClient(url="redis://localhost:6379/0")
             await c.connect()
             await c.connect()
-            mock_from.assert_called_once()
+        mock_cls.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_clients_share_pool_per_url(self) -> None:
+        with (
+            patch.object(redis_client.aioredis, "ConnectionPool") as mock_pool,
+            patch.object(redis_client.aioredis, "Redis"),
+        ):
+            mock_pool.from_url.side_effect = lambda *_a, **_k: MagicMock()
+            for url in ("redis://h/0", "redis://h/0", "redis://h/3"):
+                await RedisClient(url=url).connect()
+        assert mock_pool.from_url.call_count == 2
+        assert set(redis_client._POOLS) == {"redis://h/0", "redis://h/3"}
+
+    @pytest.mark.asyncio
+    async def test_close_pools(self) -> None:
+        pool = MagicMock()
+        pool.disconnect = AsyncMock()
+        redis_client._POOLS["redis://x"] = pool
+        await redis_client.close_pools()
+        pool.disconnect.assert_awaited_once()
+        assert redis_client._POOLS == {}
 
     @pytest.mark.asyncio
     async def test_close(self, client: RedisClient, mock_redis: AsyncMock) -> None:
@@ -95,13 +129,43 @@ class TestPubSub:
         mock_redis.publish.assert_awaited_once()
         args = mock_redis.publish.call_args
         assert args[0][0] == "ch"
-        assert '"key"' in args[0][1]  # JSON serialised
+        assert args[0][1] == b'{"key":"val"}'  # JSON serialised straight to bytes
+
+    @pytest.mark.asyncio
+    async def test_publish_dict_native_types(
+        self, client: RedisClient, mock_redis: AsyncMock,
+    ) -> None:
+        uid = uuid.UUID(int=1)
+        await client.publish("ch", {"id": uid, 1: "one"})
+        payload = mock_redis.publish.call_args[0][1]
+        assert json.loads(payload) == {"id": str(uid), "1": "one"}
 
     @pytest.mark.asyncio
     async def test_publish_string(self, client: RedisClient, mock_redis: AsyncMock) -> None:
         await client.publish("ch", "plain text")
         mock_redis.publish.assert_awaited_once_with("ch", "plain text")
 
+    @pytest.mark.asyncio
+    async def test_publish_many_pipelines(
+        self, client: RedisClient, mock_redis: AsyncMock,
+    ) -> None:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[1, 0])
+        mock_redis.pipeline = MagicMock()
+        mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+        result = await client.publish_many([("a", {"k": 1}), ("b", "raw")])
+        assert result == [1, 0]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.publish.assert_any_call("a", b'{"k":1}')
+        pipe.publish.assert_any_call("b", "raw")
+        mock_redis.publish.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_publish_many_empty(self, client: RedisClient, mock_redis: AsyncMock) -> None:
+        assert await client.publish_many([]) == []
+        mock_redis.pipeline.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_subscribe(self, client: RedisClient, mock_redis: AsyncMock) -> None:
         ps = await client.subscribe("alerts", "events")
@@ -118,15 +182,39 @@ class TestStreams:
 
     @pytest.mark.asyncio
     async def test_xadd(self, client: RedisClient, mock_redis: AsyncMock) -> None:
-        entry_id = await client.xadd("mystream", {"f": "v"})
+        entry_id = await client.xadd("mystream", {"f": "v", "g": "w"})
         assert entry_id == "1234567890-0"
-        mock_redis.xadd.assert_awaited_once()
+        mock_redis.execute_command.assert_awaited_once_with(
+            "XADD", "mystream", "*", "f", "v", "g", "w",
+        )
 
     @pytest.mark.asyncio
     async def test_xadd_with_maxlen(self, client: RedisClient, mock_redis: AsyncMock) -> None:
         await client.xadd("s", {"a": "b"}, maxlen=1000)
-        _, kwargs = mock_redis.xadd.call_args
-        assert kwargs["maxlen"] == 1000
+        mock_redis.execute_command.assert_awaited_once_with(
+            "XADD", "s", "MAXLEN", "~", 1000, "*", "a", "b",
+        )
+
+    @pytest.mark.asyncio
+    async def test_xadd_many_pipelines(
+        self, client: RedisClient, mock_redis: AsyncMock,
+    ) -> None:
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=["1-0", "1-1"])
+        mock_redis.pipeline = MagicMock()
+        mock_redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+        mock_redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=None)
+        result = await client.xadd_many("s", [{"a": "1"}, {"a": "2"}], maxlen=100)
+        assert result == ["1-0", "1-1"]
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipe.execute_command.assert_any_call("XADD", "s", "MAXLEN", "~", 100, "*", "a", "1")
+        pipe.execute_command.assert_any_call("XADD", "s", "MAXLEN", "~", 100, "*", "a", "2")
+        mock_redis.execute_command.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_xadd_many_empty(self, client: RedisClient, mock_redis: AsyncMock) -> None:
+        assert await client.xadd_many("s", []) == []
+        mock_redis.pipeline.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_xread(self, client: RedisClient, mock_redis: AsyncMock) -> None:
@@ -134,6 +222,30 @@ class TestStreams:
         assert result == []
         mock_redis.xread.assert_awaited_once()
 
+    @pytest.mark.asyncio
+    async def test_ensure_group_creates_stream(
+        self, client: RedisClient, mock_redis: AsyncMock,
+    ) -> None:
+        await client.ensure_group("s", "workers")
+        mock_redis.xgroup_create.assert_awaited_once_with("s", "workers", id="0", mkstream=True)
+
+    @pytest.mark.asyncio
+    async def test_ensure_group_ignores_existing(
+        self, client: RedisClient, mock_redis: AsyncMock,
+    ) -> None:
+        mock_redis.xgroup_create.side_effect = redis_client.aioredis.ResponseError(
+            "BUSYGROUP Consumer Group name already exists",
+        )
+        await client.ensure_group("s", "workers")
+
+    @pytest.mark.asyncio
+    async def test_xreadgroup_and_xack(self, client: RedisClient, mock_redis: AsyncMock) -> None:
+        mock_redis.xreadgroup.return_value = []
+        mock_redis.xack.return_value = 1
+        assert await client.xreadgroup("g", "c1", {"s": ">"}, count=5) == []
+        mock_redis.xreadgroup.assert_awaited_once_with("g", "c1", {"s": ">"}, count=5, block=None)
+        assert await client.xack("s", "g", "1-0") == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: health check
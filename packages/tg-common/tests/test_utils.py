@@ -0,0 +1,55 @@
+"""
+Tests for tg-common utility helpers.
+
+Validates UUIDv7 generation (version/variant bits and time ordering) and
+the enum value lookup used by model field validators.
+"""
+
+from __future__ import annotations
+
+import time
+import uuid
+from datetime import timedelta
+
+from tg_common.models.stream import SourceType
+from tg_common.utils import enum_value_lookup, utc_now, uuid7
+
+
+class TestUuid7:
+
+    def test_version_and_variant(self) -> None:
+        u = uuid7()
+        assert u.version == 7
+        assert u.variant == uuid.RFC_4122
+
+    def test_embeds_millisecond_timestamp(self) -> None:
+        before = time.time_ns() // 1_000_000
+        u = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= u.int >> 80 <= after
+
+    def test_time_ordered_across_milliseconds(self) -> None:
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
+
+    def test_unique(self) -> None:
+        assert len({uuid7() for _ in range(1000)}) == 1000
+
+
+class TestUtcNow:
+
+    def test_timezone_aware_utc(self) -> None:
+        assert utc_now().utcoffset() == timedelta(0)
+
+
+class TestEnumValueLookup:
+
+    def test_maps_value_to_member(self) -> None:
+        assert enum_value_lookup(SourceType)("rtsp") is SourceType.RTSP
+
+    def test_passes_through_unknown_and_unhashable(self) -> None:
+        lookup = enum_value_lookup(SourceType)
+        assert lookup("bogus") == "bogus"
+        assert lookup(["rtsp"]) == ["rtsp"]
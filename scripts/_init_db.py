@@ -8,7 +8,9 @@ print("Starting DB initialization...", flush=True)
 
 async def main() -> None:
     try:
+        from sqlalchemy import select, text
         from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+        from tg_common.db.bulk import ColumnBatch, bulk_insert_columns
         from tg_common.db.orm_models import Base, KeywordRuleORM
 
         url = os.environ.get(
@@ -35,18 +37,23 @@ async def main() -> None:
         ]
 
         async with factory() as session:
+            # A rerun reseeds anyway, so the commit need not wait on WAL fsync.
+            await session.execute(text("SET LOCAL synchronous_commit = off"))
+            # keyword_rules has no unique key to ON CONFLICT against, so
+            # skip rules already present to keep restarts from duplicating.
+            existing = set(
+                (await session.execute(
+                    select(KeywordRuleORM.rule_set_name, KeywordRuleORM.keyword),
+                )).tuples(),
+            )
+            batch = ColumnBatch(KeywordRuleORM)
             for r in sample_rules:
-                rule = KeywordRuleORM(
-                    rule_set_name=r["rule_set_name"],
-                    keyword=r["keyword"],
-                    match_type=r["match_type"],
-                    severity=r["severity"],
-                    category=r["category"],
-                    enabled=True,
-                )
-                session.add(rule)
+                if (r["rule_set_name"], r["keyword"]) not in existing:
+                    batch.append(**r, enabled=True)
+            # One COPY for the whole seed instead of an INSERT per rule.
+            await bulk_insert_columns(session, batch)
             await session.commit()
-        print(f"Seeded {len(sample_rules)} keyword rules.", flush=True)
+        print(f"Seeded {len(batch)} keyword rules.", flush=True)
 
         await engine.dispose()
         print("DB initialization complete!", flush=True)
@@ -6,22 +6,31 @@ Text-to-Speech (gTTS) to synthesize speech, then converts the MP3
 output to 16 kHz mono PCM WAV via the standard-library ``audioop``
 or ``pydub`` if available.
 
+Output is a pure function of the text, sample rate and mode, so results
+are cached under ``$TG_AUDIO_CACHE`` (default: a ``voxsentinel_audio``
+directory in the system temp dir) and reused on later runs.
+
 Usage:
     python scripts/generate_test_audio.py
     python scripts/generate_test_audio.py --output tests/fixtures/test_audio_keywords.wav
+    python scripts/generate_test_audio.py --no-cache
 """
 
 from __future__ import annotations
 
 import argparse
+import hashlib
 import io
-import math
-import struct
+import os
+import shutil
 import subprocess
 import sys
+import tempfile
 import wave
 from pathlib import Path
 
+import numpy as np
+
 
 _DEFAULT_TEXT = "There is a fire near the entrance and I need help"
 _DEFAULT_OUTPUT = "tests/fixtures/test_audio_keywords.wav"
@@ -54,9 +63,35 @@ def parse_args() -> argparse.Namespace:
         default=False,
         help="Generate synthetic WAV (no gTTS/ffmpeg needed)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        default=False,
+        help="Regenerate even if a cached WAV exists",
+    )
     return parser.parse_args()
 
 
+def _cache_path(text: str, sample_rate: int, synthetic: bool) -> Path:
+    """Return the cache file for a given generation request."""
+    key = hashlib.sha256(f"{text}|{sample_rate}|{synthetic}".encode()).hexdigest()[:16]
+    root = os.environ.get("TG_AUDIO_CACHE") or Path(tempfile.gettempdir()) / "voxsentinel_audio"
+    return Path(root) / f"{key}.wav"
+
+
+def _write_cache(path: Path, data: bytes) -> None:
+    """Write *data* to *path* atomically so readers never see a partial WAV."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def _synthetic_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
     """Generate a synthetic 16-bit mono PCM WAV with tone bursts.
 
@@ -66,47 +101,56 @@ def _synthetic_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
     needing gTTS or ffmpeg.
     """
     words = text.split()
-    samples: list[int] = []
     silence_samples = int(sample_rate * 0.15)  # 150ms silence between words
     word_duration = 0.35  # seconds per word
-
+    n_samples = int(sample_rate * word_duration)
+
+    # Envelope and time base are identical for every word, so build them
+    # once; fade in/out avoids clicks.
+    i = np.arange(n_samples)
+    t = i / sample_rate
+    fade = int(sample_rate * 0.01)
+    env = np.ones(n_samples)
+    env[:fade] = i[:fade] / fade
+    tail = i > n_samples - fade
+    env[tail] = (n_samples - i[tail]) / fade
+    silence = np.zeros(silence_samples, dtype=np.int16)
+
+    chunks: list[np.ndarray] = []
     for idx, _word in enumerate(words):
         freq = 200 + idx * 50  # unique freq per word
-        n_samples = int(sample_rate * word_duration)
-        for i in range(n_samples):
-            t = i / sample_rate
-            # Fade in/out envelope to avoid clicks
-            env = 1.0
-            fade = int(sample_rate * 0.01)
-            if i < fade:
-                env = i / fade
-            elif i > n_samples - fade:
-                env = (n_samples - i) / fade
-            val = int(env * 16000 * math.sin(2 * math.pi * freq * t))
-            val = max(-32768, min(32767, val))
-            samples.append(val)
-        samples.extend([0] * silence_samples)
+        # Peak amplitude is 16000, so the int16 cast cannot overflow.
+        chunks.append((env * 16000 * np.sin(2 * np.pi * freq * t)).astype(np.int16))
+        chunks.append(silence)
+    samples = np.concatenate(chunks) if chunks else silence[:0]
+
+    return _pcm_to_wav(samples.astype("<i2").tobytes(), sample_rate)
 
+
+def _pcm_to_wav(pcm: bytes, sample_rate: int) -> bytes:
+    """Wrap 16-bit little-endian mono PCM in a WAV container."""
     buf = io.BytesIO()
     with wave.open(buf, "wb") as wf:
         wf.setnchannels(1)
         wf.setsampwidth(2)
         wf.setframerate(sample_rate)
-        wf.writeframes(struct.pack(f"<{len(samples)}h", *samples))
+        wf.writeframes(pcm)
     return buf.getvalue()
 
 
-def _gtts_to_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
+def _gtts_to_wav_bytes(text: str, sample_rate: int = 16000) -> tuple[bytes, bool]:
     """Synthesise *text* with gTTS and return 16-bit mono PCM WAV bytes.
 
-    First attempts conversion via pydub (if installed), falling back
-    to ffmpeg on the system PATH, then to synthetic audio.
+    First decodes in-process with PyAV (if installed), then tries pydub,
+    then an ffmpeg subprocess on the system PATH, and finally falls back
+    to synthetic audio.  The second element of the result is ``True``
+    when that fallback was used.
     """
     try:
         from gtts import gTTS
     except ImportError:
         print("gTTS not available, falling back to synthetic audio", file=sys.stderr)
-        return _synthetic_wav_bytes(text, sample_rate)
+        return _synthetic_wav_bytes(text, sample_rate), True
 
     try:
         tts = gTTS(text=text, lang="en")
@@ -115,9 +159,25 @@ def _gtts_to_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
         mp3_buf.seek(0)
     except Exception as exc:
         print(f"gTTS synthesis failed ({exc}), falling back to synthetic audio", file=sys.stderr)
-        return _synthetic_wav_bytes(text, sample_rate)
+        return _synthetic_wav_bytes(text, sample_rate), True
 
-    # ── Try pydub first ──
+    # ── Try PyAV first: decodes in-process, no ffmpeg fork or pipes ──
+    try:
+        import av
+
+        resampler = av.AudioResampler(format="s16", layout="mono", rate=sample_rate)
+        pcm = bytearray()
+        with av.open(mp3_buf) as container:
+            for frame in container.decode(audio=0):
+                for out in resampler.resample(frame):
+                    pcm += out.to_ndarray().tobytes()
+        for out in resampler.resample(None):  # flush buffered samples
+            pcm += out.to_ndarray().tobytes()
+        return _pcm_to_wav(bytes(pcm), sample_rate), False
+    except Exception:
+        mp3_buf.seek(0)
+
+    # ── Then pydub (which itself shells out to ffmpeg) ──
     try:
         from pydub import AudioSegment
 
@@ -125,7 +185,7 @@ def _gtts_to_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
         audio = audio.set_frame_rate(sample_rate).set_channels(1).set_sample_width(2)
         wav_buf = io.BytesIO()
         audio.export(wav_buf, format="wav")
-        return wav_buf.getvalue()
+        return wav_buf.getvalue(), False
     except Exception:
         pass
 
@@ -146,13 +206,13 @@ def _gtts_to_wav_bytes(text: str, sample_rate: int = 16000) -> bytes:
             capture_output=True,
             check=True,
         )
-        return result.stdout
+        return result.stdout, False
     except (FileNotFoundError, subprocess.CalledProcessError):
         pass
 
     # ── Final fallback: synthetic ──
-    print("Neither pydub+ffmpeg nor ffmpeg on PATH. Using synthetic WAV.", file=sys.stderr)
-    return _synthetic_wav_bytes(text, sample_rate)
+    print("Neither PyAV, pydub+ffmpeg nor ffmpeg on PATH. Using synthetic WAV.", file=sys.stderr)
+    return _synthetic_wav_bytes(text, sample_rate), True
 
 
 def main() -> None:
@@ -161,14 +221,23 @@ def main() -> None:
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    print(f"Generating audio: \"{args.text}\"")
-    if args.synthetic:
-        wav_data = _synthetic_wav_bytes(args.text, sample_rate=args.sample_rate)
+    cache = _cache_path(args.text, args.sample_rate, args.synthetic)
+    if cache.exists() and not args.no_cache:
+        print(f"Using cached audio: {cache}")
+        # Copied file-to-file so the WAV is never re-read into memory.
+        shutil.copyfile(cache, output_path)
     else:
-        wav_data = _gtts_to_wav_bytes(args.text, sample_rate=args.sample_rate)
-
-    output_path.write_bytes(wav_data)
-    print(f"Saved {output_path}  ({len(wav_data):,} bytes)")
+        print(f"Generating audio: \"{args.text}\"")
+        if args.synthetic:
+            wav_data, synthetic = _synthetic_wav_bytes(args.text, sample_rate=args.sample_rate), True
+        else:
+            wav_data, synthetic = _gtts_to_wav_bytes(args.text, sample_rate=args.sample_rate)
+        output_path.write_bytes(wav_data)
+        # A synthetic fallback must not be served later as real speech.
+        if synthetic == args.synthetic:
+            _write_cache(cache, wav_data)
+
+    print(f"Saved {output_path}  ({output_path.stat().st_size:,} bytes)")
 
 
 if __name__ == "__main__":
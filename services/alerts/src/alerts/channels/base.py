@@ -43,5 +43,22 @@ class AlertChannel(ABC):
             dispatcher will queue the alert for retry via Celery).
         """
 
+    async def send_prepared(self, alert: Alert, payload: str) -> bool:
+        """Deliver *alert* given its pre-serialised JSON *payload*.
+
+        The dispatcher serialises each alert once and hands the result to
+        every channel.  Channels whose wire format is the alert's JSON
+        override this to reuse *payload*; the default ignores it and
+        calls :meth:`send`.
+
+        Args:
+            alert: Fully-populated Alert Pydantic model.
+            payload: ``alert.model_dump_json()``.
+
+        Returns:
+            ``True`` if delivery succeeded, ``False`` otherwise.
+        """
+        return await self.send(alert)
+
     async def close(self) -> None:
         """Release any resources held by the channel (override if needed)."""
@@ -30,7 +30,7 @@ def _format_slack_blocks(alert: Alert) -> list[dict[str, Any]]:
     ts = alert.created_at
     if ts.tzinfo is None:
         ts = ts.replace(tzinfo=timezone.utc)
-    ts_str = ts.strftime("%Y-%m-%d %H:%M:%S UTC")
+    ts_str = f"{ts:%Y-%m-%d %H:%M:%S} UTC"
 
     header = (
         f"*{alert.matched_rule or alert.alert_type.value}*  |  "
@@ -39,7 +39,7 @@ def _format_slack_blocks(alert: Alert) -> list[dict[str, Any]]:
         f"`{ts_str}`"
     )
     context_snippet = alert.surrounding_context[:300] if alert.surrounding_context else "(no context)"
-    blocks: list[dict[str, Any]] = [
+    return [
         {
             "type": "section",
             "text": {"type": "mrkdwn", "text": header},
@@ -62,7 +62,6 @@ def _format_slack_blocks(alert: Alert) -> list[dict[str, Any]]:
             ],
         },
     ]
-    return blocks
 
 
 class SlackChannel(AlertChannel):
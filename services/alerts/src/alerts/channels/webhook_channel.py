@@ -7,12 +7,10 @@ webhook URLs with retry logic (3 attempts, exponential backoff).
 
 from __future__ import annotations
 
-from typing import Any
-
 import httpx
 import structlog
 from tenacity import (
-    retry,
+    AsyncRetrying,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
@@ -28,6 +26,35 @@ logger = structlog.get_logger()
 _DEFAULT_MAX_ATTEMPTS = 3
 _DEFAULT_TIMEOUT_S = 10.0
 
+# One connection pool shared by every WebhookChannel in the process, so
+# destinations on the same host reuse connections and TLS sessions.
+_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+_shared_client: httpx.AsyncClient | None = None
+_shared_users = 0
+
+
+def _acquire_client() -> httpx.AsyncClient:
+    """Return the process-wide client, creating it on first use."""
+    global _shared_client, _shared_users
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(timeout=_DEFAULT_TIMEOUT_S, limits=_POOL_LIMITS)
+        _shared_users = 0
+    _shared_users += 1
+    return _shared_client
+
+
+async def _release_client(client: httpx.AsyncClient) -> None:
+    """Drop one reference to *client*, closing it when none remain."""
+    global _shared_client, _shared_users
+    if client is not _shared_client:
+        return
+    _shared_users -= 1
+    if _shared_users <= 0:
+        _shared_client = None
+        _shared_users = 0
+        if not client.is_closed:
+            await client.aclose()
+
 
 class WebhookChannel(AlertChannel):
     """Deliver alerts as HTTP POST JSON payloads to a webhook URL.
@@ -57,42 +84,42 @@ class WebhookChannel(AlertChannel):
         self.timeout = timeout
         self.headers = headers or {}
         self._client: httpx.AsyncClient | None = None
+        self._retrying = AsyncRetrying(
+            stop=stop_after_attempt(max_attempts),
+            wait=wait_exponential(multiplier=1, min=1, max=10),
+            retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TransportError)),
+            reraise=True,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Return (and lazily create) the shared ``httpx.AsyncClient``."""
+        """Return the process-wide ``httpx.AsyncClient``, acquiring it lazily."""
         if self._client is None or self._client.is_closed:
-            self._client = httpx.AsyncClient(timeout=self.timeout)
+            self._client = _acquire_client()
         return self._client
 
     # ── delivery ──
 
-    async def _post_with_retry(self, payload: dict[str, Any]) -> httpx.Response:
-        """POST *payload* to the configured URL with retry.
+    async def _post_with_retry(self, body: bytes) -> httpx.Response:
+        """POST the JSON *body* to the configured URL with retry.
 
-        The retry decorator is built dynamically so ``max_attempts`` can be
-        set at construction time rather than module-import time.
+        The retry policy is built once in ``__init__``; each call iterates
+        a copy of it because ``AsyncRetrying`` keeps per-call state on the
+        instance, which concurrent deliveries would otherwise share.
         """
-
-        @retry(
-            stop=stop_after_attempt(self.max_attempts),
-            wait=wait_exponential(multiplier=1, min=1, max=10),
-            retry=retry_if_exception_type((httpx.HTTPStatusError, httpx.TransportError)),
-            reraise=True,
-        )
-        async def _inner() -> httpx.Response:
-            client = await self._get_client()
-            resp = await client.post(
-                self.url,
-                json=payload,
-                headers={
-                    "Content-Type": "application/json",
-                    **self.headers,
-                },
-            )
-            resp.raise_for_status()
-            return resp
-
-        return await _inner()
+        async for attempt in self._retrying.copy():
+            with attempt:
+                client = await self._get_client()
+                resp = await client.post(
+                    self.url,
+                    content=body,
+                    timeout=self.timeout,
+                    headers={
+                        "Content-Type": "application/json",
+                        **self.headers,
+                    },
+                )
+                resp.raise_for_status()
+        return resp
 
     async def send(self, alert: Alert) -> bool:
         """Deliver *alert* via HTTP POST.
@@ -101,10 +128,20 @@ class WebhookChannel(AlertChannel):
             ``True`` on a 2xx response, ``False`` if all retries are
             exhausted or an unexpected error occurs.
         """
-        payload = alert.model_dump(mode="json")
+        return await self.send_prepared(alert, alert.model_dump_json())
+
+    async def send_prepared(self, alert: Alert, payload: str) -> bool:
+        """Deliver *alert* via HTTP POST, posting *payload* as the body.
+
+        Returns:
+            ``True`` on a 2xx response, ``False`` if all retries are
+            exhausted or an unexpected error occurs.
+        """
+        # Encoded once; every retry resends the same bytes.
+        body = payload.encode()
         log = logger.bind(webhook_url=self.url, alert_id=str(alert.alert_id))
         try:
-            resp = await self._post_with_retry(payload)
+            resp = await self._post_with_retry(body)
             log.info("webhook_delivered", status=resp.status_code)
             return True
         except (httpx.HTTPStatusError, httpx.TransportError) as exc:
@@ -115,7 +152,7 @@ class WebhookChannel(AlertChannel):
             return False
 
     async def close(self) -> None:
-        """Close the underlying HTTP client."""
-        if self._client is not None and not self._client.is_closed:
-            await self._client.aclose()
-            self._client = None
+        """Release the shared HTTP client, closing it after the last channel."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await _release_client(client)
@@ -7,7 +7,7 @@ connections in real time (<50 ms from event generation).
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
@@ -19,6 +19,10 @@ from .base import AlertChannel
 
 logger = structlog.get_logger()
 
+# A client whose send has not completed within this many seconds is
+# treated as stale so it cannot hold up the rest of the broadcast.
+_DEFAULT_SEND_TIMEOUT_S = 5.0
+
 
 class WebSocketChannel(AlertChannel):
     """Broadcast alerts to dashboard clients over WebSocket.
@@ -30,11 +34,16 @@ class WebSocketChannel(AlertChannel):
 
     Attributes:
         name: Channel identifier used in delivery tracking.
+
+    Args:
+        send_timeout: Seconds a single client send may take before the
+            client is dropped (default 5).
     """
 
     name: str = "websocket"
 
-    def __init__(self) -> None:
+    def __init__(self, *, send_timeout: float = _DEFAULT_SEND_TIMEOUT_S) -> None:
+        self.send_timeout = send_timeout
         # stream_id → set of open websocket connections
         self._clients: dict[str, set[Any]] = {}
 
@@ -75,12 +84,19 @@ class WebSocketChannel(AlertChannel):
 
     # ── delivery ──
 
-    async def broadcast(self, stream_id: str, alert: Alert) -> int:
+    async def broadcast(
+        self,
+        stream_id: str,
+        alert: Alert,
+        payload: str | None = None,
+    ) -> int:
         """Send *alert* to all clients watching *stream_id*.
 
         Args:
             stream_id: Target stream.
             alert: The alert to broadcast.
+            payload: Pre-serialised ``alert.model_dump_json()``, if the
+                caller already has it.
 
         Returns:
             The number of clients the alert was successfully delivered to.
@@ -89,16 +105,25 @@ class WebSocketChannel(AlertChannel):
         if not clients:
             return 0
 
-        payload = json.dumps(alert.model_dump(mode="json"))
+        if payload is None:
+            payload = alert.model_dump_json()
         delivered = 0
         stale: list[Any] = []
 
-        for ws in clients:
-            try:
-                await ws.send(payload)
-                delivered += 1
-            except (websockets.ConnectionClosed, OSError):
+        # Send to every client concurrently so one slow socket does not
+        # delay the others.
+        targets = list(clients)
+        results = await asyncio.gather(
+            *(asyncio.wait_for(ws.send(payload), self.send_timeout) for ws in targets),
+            return_exceptions=True,
+        )
+        for ws, result in zip(targets, results):
+            if isinstance(result, (websockets.ConnectionClosed, OSError, TimeoutError)):
                 stale.append(ws)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                delivered += 1
 
         # Prune disconnected clients.
         for ws in stale:
@@ -127,6 +152,16 @@ class WebSocketChannel(AlertChannel):
         delivered = await self.broadcast(stream_id, alert)
         return delivered > 0
 
+    async def send_prepared(self, alert: Alert, payload: str) -> bool:
+        """Send *alert* to its stream's clients, reusing *payload*.
+
+        Returns:
+            ``True`` if at least one client received the alert,
+            ``False`` otherwise.
+        """
+        delivered = await self.broadcast(str(alert.stream_id), alert, payload)
+        return delivered > 0
+
     async def close(self) -> None:
         """Clear the client registry (connections are not closed here)."""
         self._clients.clear()
@@ -18,10 +18,11 @@ Flow
 
 from __future__ import annotations
 
-import json
+import asyncio
 from typing import Any
 
 import structlog
+from pydantic import ValidationError
 
 from tg_common.models.alert import (
     Alert,
@@ -37,6 +38,10 @@ from .throttle import AlertThrottle
 
 logger = structlog.get_logger()
 
+# Upper bound on pub/sub messages drained from the socket buffer and
+# dispatched together by :meth:`AlertDispatcher.listen`.
+_LISTEN_BATCH = 100
+
 
 def _keyword_event_to_alert(event: KeywordMatchEvent) -> Alert:
     """Convert a :class:`KeywordMatchEvent` to an :class:`Alert`."""
@@ -109,19 +114,16 @@ class AlertDispatcher:
         Returns:
             An ``Alert`` or ``None`` if the message cannot be parsed.
         """
-        try:
-            data = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
-            logger.warning("event_parse_failed", channel=channel_name)
-            return None
-
         try:
             if channel_name.startswith("match_events"):
-                event = KeywordMatchEvent(**data)
-                return _keyword_event_to_alert(event)
+                return _keyword_event_to_alert(KeywordMatchEvent.model_validate_json(raw))
             if channel_name.startswith("sentiment_events"):
-                event_s = SentimentEvent(**data)
-                return _sentiment_event_to_alert(event_s)
+                return _sentiment_event_to_alert(SentimentEvent.model_validate_json(raw))
+        except ValidationError as exc:
+            if any(err["type"] in ("json_invalid", "json_type") for err in exc.errors()):
+                logger.warning("event_parse_failed", channel=channel_name)
+            else:
+                logger.warning("event_model_error", channel=channel_name, error=str(exc))
         except Exception as exc:  # noqa: BLE001
             logger.warning("event_model_error", channel=channel_name, error=str(exc))
         return None
@@ -132,11 +134,10 @@ class AlertDispatcher:
         """Run the full dispatch pipeline for *alert*.
 
         Steps:
-            1. Dedup check — skip if duplicate.
-            2. Throttle check — skip if throttled.
-            3. Fan-out to all enabled channels.
-            4. Record alert in rate-limit window.
-            5. Persist alert.
+            1. Admit — dedup check, throttle check and rate-limit record
+               in one atomic Redis call; skip if duplicate or throttled.
+            2. Fan-out to all enabled channels.
+            3. Persist alert.
 
         Returns:
             ``True`` if the alert was dispatched to at least one channel.
@@ -146,26 +147,39 @@ class AlertDispatcher:
         match_type = alert.match_type.value
         log = logger.bind(stream_id=stream_id, alert_id=str(alert.alert_id))
 
-        # 1. Dedup
-        if await self.throttle.is_duplicate(stream_id, keyword, match_type):
+        # 1. Admit
+        is_dup, is_throttled = await self.throttle.admit(stream_id, keyword, match_type)
+        if is_dup:
             log.info("alert_suppressed_dedup")
             alert.deduplicated = True
             return False
-
-        # 2. Throttle
-        if await self.throttle.is_throttled(stream_id):
+        if is_throttled:
             log.info("alert_suppressed_throttle")
             return False
 
-        # 3. Fan-out
+        # 2. Fan-out
+        delivered_to = await self._fan_out(alert, log)
+
+        # 3. Persist
+        await self._persist(alert, log)
+        return len(delivered_to) > 0
+
+    async def _fan_out(self, alert: Alert, log: Any) -> list[str]:
+        """Send *alert* to every enabled channel and record the outcome.
+
+        Returns:
+            Names of the channels that accepted the alert.
+        """
         delivered_to: list[str] = []
         delivery_status: dict[str, str] = {}
+        # Serialised once and shared by every channel that sends JSON.
+        payload = alert.model_dump_json()
 
         for ch in self.channels:
             if not ch.enabled:
                 continue
             try:
-                ok = await ch.send(alert)
+                ok = await ch.send_prepared(alert, payload)
                 if ok:
                     delivered_to.append(ch.name)
                     delivery_status[ch.name] = "delivered"
@@ -181,11 +195,10 @@ class AlertDispatcher:
 
         alert.delivered_to = delivered_to
         alert.delivery_status = delivery_status
+        return delivered_to
 
-        # 4. Record for rate-limit
-        await self.throttle.record(stream_id)
-
-        # 5. Persist
+    async def _persist(self, alert: Alert, log: Any) -> None:
+        """Write *alert* with the configured writer and log the dispatch."""
         if self._alert_writer is not None:
             try:
                 await self._alert_writer(alert)
@@ -194,18 +207,20 @@ class AlertDispatcher:
 
         log.info(
             "alert_dispatched",
-            delivered_to=delivered_to,
-            delivery_status=delivery_status,
+            delivered_to=alert.delivered_to,
+            delivery_status=alert.delivery_status,
         )
-        return len(delivered_to) > 0
 
     # ── pub/sub listener ──
 
     async def listen(self, pubsub: Any) -> None:
         """Consume messages from a Redis ``PubSub`` and dispatch alerts.
 
-        This is the main event loop — runs forever (or until the pubsub
-        connection is closed / an ``asyncio.CancelledError`` is raised).
+        This is the main event loop — runs until the pubsub connection is
+        unsubscribed / closed or an ``asyncio.CancelledError`` is raised.
+        After each blocking read, messages already buffered on the socket
+        are drained without waiting (up to ``_LISTEN_BATCH``) and
+        dispatched together; see :meth:`dispatch_batch`.
 
         Args:
             pubsub: An ``aioredis.client.PubSub`` already subscribed to
@@ -213,11 +228,65 @@ class AlertDispatcher:
         """
         log = logger.bind(component="dispatcher_listener")
         log.info("dispatcher_listening")
-        async for message in pubsub.listen():
-            if message["type"] != "message":
+        while pubsub.subscribed:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+            if message is None:
+                continue
+            batch = [message]
+            while len(batch) < _LISTEN_BATCH:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=0.0)
+                if message is None:
+                    break
+                batch.append(message)
+            await self.dispatch_batch(batch)
+
+    async def dispatch_batch(self, messages: list[dict[str, Any]]) -> None:
+        """Parse and dispatch a batch of pub/sub *messages*.
+
+        Runs the same pipeline as :meth:`dispatch`, but the admit calls
+        for the whole batch share one Redis pipeline.  Alerts for different
+        streams are fanned out concurrently; alerts for the same stream
+        keep their arrival order.
+
+        Args:
+            messages: ``PubSub`` message dicts (``message`` or ``pmessage``).
+        """
+        alerts: list[Alert] = []
+        for message in messages:
+            if message["type"] not in ("message", "pmessage"):
                 continue
             channel_name: str = message.get("channel", "")
             raw: str = message.get("data", "")
             alert = self.parse_event(channel_name, raw)
             if alert is not None:
-                await self.dispatch(alert)
+                alerts.append(alert)
+        if not alerts:
+            return
+
+        decisions = await self.throttle.admit_batch([
+            (
+                str(alert.stream_id),
+                alert.matched_rule or alert.alert_type.value,
+                alert.match_type.value,
+            )
+            for alert in alerts
+        ])
+
+        by_stream: dict[str, list[Alert]] = {}
+        for alert, (is_dup, is_throttled) in zip(alerts, decisions):
+            log = logger.bind(stream_id=str(alert.stream_id), alert_id=str(alert.alert_id))
+            if is_dup:
+                log.info("alert_suppressed_dedup")
+                alert.deduplicated = True
+            elif is_throttled:
+                log.info("alert_suppressed_throttle")
+            else:
+                by_stream.setdefault(str(alert.stream_id), []).append(alert)
+
+        async def _deliver_in_order(stream_alerts: list[Alert]) -> None:
+            for alert in stream_alerts:
+                log = logger.bind(stream_id=str(alert.stream_id), alert_id=str(alert.alert_id))
+                await self._fan_out(alert, log)
+                await self._persist(alert, log)
+
+        await asyncio.gather(*(_deliver_in_order(a) for a in by_stream.values()))
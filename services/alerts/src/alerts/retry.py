@@ -7,8 +7,6 @@ exponential backoff, ensuring reliable delivery across all channels.
 
 from __future__ import annotations
 
-import json
-
 import structlog
 from celery import shared_task
 
@@ -53,7 +51,7 @@ def retry_failed_alert(
     log.info("retry_failed_alert_start")
 
     try:
-        alert = Alert(**json.loads(alert_json))
+        alert = Alert.model_validate_json(alert_json)
     except Exception as exc:  # noqa: BLE001
         log.error("retry_deserialize_failed", error=str(exc))
         return False
@@ -14,10 +14,16 @@ Implementation
   ``dedup:{stream_id}:{keyword}:{match_type}`` with a configurable TTL
   (default 10 s).  If the key already exists the alert is considered a
   duplicate.
+
+On the dispatch path all three steps run server-side in one Lua script
+(:meth:`AlertThrottle.admit`), so each decision is atomic and costs one
+round-trip; :meth:`AlertThrottle.admit_batch` pipelines the script for a
+whole burst.
 """
 
 from __future__ import annotations
 
+import itertools
 import time
 from typing import Any
 
@@ -29,6 +35,22 @@ logger = structlog.get_logger()
 _DEFAULT_MAX_PER_MINUTE = 30
 _DEFAULT_DEDUP_TTL_S = 10
 
+# KEYS: dedup key, throttle key.
+# ARGV: now, dedup TTL, max per minute, sorted-set member.
+# Returns {is_duplicate, is_throttled}; admitted alerts are recorded.
+_ADMIT_LUA = """
+if not redis.call('SET', KEYS[1], '1', 'NX', 'EX', ARGV[2]) then
+    return {1, 0}
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[2], '-inf', tonumber(ARGV[1]) - 60)
+if redis.call('ZCARD', KEYS[2]) >= tonumber(ARGV[3]) then
+    return {0, 1}
+end
+redis.call('ZADD', KEYS[2], ARGV[1], ARGV[4])
+redis.call('EXPIRE', KEYS[2], 120)
+return {0, 0}
+"""
+
 
 class AlertThrottle:
     """Rate-limiter and deduplicator backed by Redis.
@@ -51,6 +73,10 @@ class AlertThrottle:
         self._redis = redis
         self.max_per_minute = max_per_minute
         self.dedup_ttl_s = dedup_ttl_s
+        # Sent with EVALSHA; redis-py reloads it on NOSCRIPT.
+        self._admit_script = redis.register_script(_ADMIT_LUA)
+        # Keeps sorted-set members distinct for alerts with equal timestamps.
+        self._seq = itertools.count()
 
     # ── deduplication ──
 
@@ -129,3 +155,78 @@ class AlertThrottle:
         # Auto-expire the key after 120 s as a safety net.
         pipe.expire(key, 120)
         await pipe.execute()
+
+    # ── atomic admit ──
+
+    def _admit_args(
+        self,
+        stream_id: str,
+        keyword: str,
+        match_type: str,
+    ) -> tuple[list[str], list[Any]]:
+        """Return the ``(keys, args)`` for one run of the admit script."""
+        now = time.time()
+        keys = [f"dedup:{stream_id}:{keyword}:{match_type}", f"throttle:{stream_id}"]
+        args = [now, self.dedup_ttl_s, self.max_per_minute, f"{now}:{next(self._seq)}"]
+        return keys, args
+
+    def _log_decision(self, stream_id: str, keyword: str, result: list[int]) -> tuple[bool, bool]:
+        """Convert a script result to booleans, logging suppressions."""
+        is_dup, is_throttled = bool(result[0]), bool(result[1])
+        if is_dup:
+            logger.debug("alert_deduplicated", stream_id=stream_id, keyword=keyword)
+        elif is_throttled:
+            logger.warning("alert_throttled", stream_id=stream_id, max=self.max_per_minute)
+        return is_dup, is_throttled
+
+    async def admit(
+        self,
+        stream_id: str,
+        keyword: str,
+        match_type: str,
+    ) -> tuple[bool, bool]:
+        """Dedup-check, throttle-check and record an alert in one atomic call.
+
+        Equivalent to :meth:`is_duplicate`, then :meth:`is_throttled`,
+        then :meth:`record` if neither suppressed the alert, but executed
+        server-side as a single Lua script.
+
+        Args:
+            stream_id: Stream identifier.
+            keyword: The matched keyword/rule.
+            match_type: Matching strategy (exact/fuzzy/regex/…).
+
+        Returns:
+            ``(is_duplicate, is_throttled)``; ``is_throttled`` is ``False``
+            for duplicates.
+        """
+        keys, args = self._admit_args(stream_id, keyword, match_type)
+        result = await self._admit_script(keys=keys, args=args)
+        return self._log_decision(stream_id, keyword, result)
+
+    async def admit_batch(
+        self,
+        events: list[tuple[str, str, str]],
+    ) -> list[tuple[bool, bool]]:
+        """Run :meth:`admit` for several alerts in one pipelined round-trip.
+
+        Each script run stays atomic, and alerts admitted earlier in the
+        batch count towards the rate limit of later ones.
+
+        Args:
+            events: ``(stream_id, keyword, match_type)`` tuples.
+
+        Returns:
+            ``(is_duplicate, is_throttled)`` per event, in order.
+        """
+        if not events:
+            return []
+        pipe = self._redis.pipeline(transaction=False)
+        for stream_id, keyword, match_type in events:
+            keys, args = self._admit_args(stream_id, keyword, match_type)
+            await self._admit_script(keys=keys, args=args, client=pipe)
+        results = await pipe.execute()
+        return [
+            self._log_decision(stream_id, keyword, result)
+            for (stream_id, keyword, _match_type), result in zip(events, results)
+        ]
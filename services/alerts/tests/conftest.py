@@ -85,6 +85,9 @@ def mock_redis() -> AsyncMock:
     pipe.execute = AsyncMock(return_value=[0, 0])  # [zremrangebyscore, zcard]
     redis.pipeline = MagicMock(return_value=pipe)
 
+    # Admit script — returns {is_duplicate, is_throttled}; admitted by default.
+    redis.register_script = MagicMock(return_value=AsyncMock(return_value=[0, 0]))
+
     return redis
 
 
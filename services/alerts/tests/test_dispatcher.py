@@ -29,6 +29,11 @@ def _make_channel(name: str = "test", send_ok: bool = True) -> MagicMock:
     ch.name = name
     ch.enabled = True
     ch.send = AsyncMock(return_value=send_ok)
+
+    async def _send_prepared(alert, _payload):
+        return await ch.send(alert)
+
+    ch.send_prepared = AsyncMock(side_effect=_send_prepared)
     return ch
 
 
@@ -136,6 +141,19 @@ class TestDispatchPipeline:
         ch1.send.assert_awaited_once()
         ch2.send.assert_awaited_once()
 
+    async def test_dispatch_serialises_once_for_all_channels(
+        self, mock_redis, sample_alert
+    ) -> None:
+        throttle = _make_throttle(mock_redis)
+        ch1 = _make_channel("ws")
+        ch2 = _make_channel("webhook")
+        dispatcher = AlertDispatcher(throttle, [ch1, ch2])
+
+        await dispatcher.dispatch(sample_alert)
+        payload = ch1.send_prepared.call_args.args[1]
+        assert ch2.send_prepared.call_args.args[1] is payload
+        assert json.loads(payload)["alert_id"] == str(sample_alert.alert_id)
+
     async def test_dispatch_skips_disabled_channels(
         self, mock_redis, sample_alert
     ) -> None:
@@ -202,7 +220,7 @@ class TestDispatchDedup:
     async def test_duplicate_alert_is_suppressed(
         self, mock_redis, sample_alert
     ) -> None:
-        mock_redis.set = AsyncMock(return_value=None)  # already exists
+        mock_redis.register_script.return_value.return_value = [1, 0]  # already seen
         throttle = _make_throttle(mock_redis)
         ch = _make_channel("ws")
         dispatcher = AlertDispatcher(throttle, [ch])
@@ -222,9 +240,7 @@ class TestDispatchThrottle:
     async def test_throttled_alert_is_suppressed(
         self, mock_redis, sample_alert
     ) -> None:
-        mock_redis.set = AsyncMock(return_value=True)  # dedup passes
-        pipe = mock_redis.pipeline()
-        pipe.execute = AsyncMock(return_value=[0, 30])  # at limit
+        mock_redis.register_script.return_value.return_value = [0, 1]  # at limit
         throttle = AlertThrottle(mock_redis, max_per_minute=30)
         ch = _make_channel("ws")
         dispatcher = AlertDispatcher(throttle, [ch])
@@ -264,3 +280,87 @@ class TestDispatchErrors:
         result = await dispatcher.dispatch(sample_alert)
         assert result is True
 
+
+# ── pub/sub listener ──
+
+
+class _FakePubSub:
+    """Minimal ``PubSub`` stand-in that yields queued messages, then stops."""
+
+    def __init__(self, messages: list[dict]) -> None:
+        self._messages = list(messages)
+        self.subscribed = True
+        self.timeouts: list[float | None] = []
+
+    async def get_message(self, ignore_subscribe_messages: bool, timeout):
+        self.timeouts.append(timeout)
+        if self._messages:
+            return self._messages.pop(0)
+        if timeout is None:
+            self.subscribed = False
+        return None
+
+
+class TestListen:
+    """Tests for the batched pub/sub listener."""
+
+    async def test_listen_drains_buffered_messages_as_one_batch(
+        self, stream_id, session_id
+    ) -> None:
+        data = {
+            "keyword": "gun",
+            "match_type": "exact",
+            "matched_text": "gun",
+            "stream_id": stream_id,
+            "session_id": session_id,
+        }
+        messages = [
+            {"type": "pmessage", "channel": "match_events:1", "data": json.dumps(data)}
+            for _ in range(3)
+        ]
+        pubsub = _FakePubSub(messages)
+        throttle = MagicMock()
+        throttle.admit_batch = AsyncMock(return_value=[(False, False)] * 3)
+        ch = _make_channel("ws")
+        dispatcher = AlertDispatcher(throttle, [ch])
+
+        await dispatcher.listen(pubsub)
+
+        throttle.admit_batch.assert_awaited_once()
+        assert ch.send_prepared.await_count == 3
+        # One blocking read, then non-blocking drains until empty.
+        assert pubsub.timeouts[:4] == [None, 0.0, 0.0, 0.0]
+
+    async def test_dispatch_batch_skips_suppressed_alerts(
+        self, stream_id, session_id
+    ) -> None:
+        data = {
+            "keyword": "gun",
+            "match_type": "exact",
+            "matched_text": "gun",
+            "stream_id": stream_id,
+            "session_id": session_id,
+        }
+        messages = [
+            {"type": "message", "channel": "match_events:1", "data": json.dumps(data)}
+            for _ in range(3)
+        ]
+        throttle = MagicMock()
+        throttle.admit_batch = AsyncMock(
+            return_value=[(False, False), (True, False), (False, True)],
+        )
+        ch = _make_channel("ws")
+        dispatcher = AlertDispatcher(throttle, [ch])
+
+        await dispatcher.dispatch_batch(messages)
+
+        assert ch.send_prepared.await_count == 1
+
+    async def test_dispatch_batch_skips_non_messages(self) -> None:
+        throttle = MagicMock()
+        throttle.admit_batch = AsyncMock()
+        dispatcher = AlertDispatcher(throttle, [])
+
+        await dispatcher.dispatch_batch([{"type": "psubscribe", "channel": "x", "data": 1}])
+
+        throttle.admit_batch.assert_not_awaited()
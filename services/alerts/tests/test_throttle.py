@@ -134,3 +134,52 @@ class TestRecord:
         key = pipe.zadd.call_args[0][0]
         assert key == f"throttle:{stream_id}"
 
+
+# ── atomic admit ──
+
+
+class TestAdmit:
+    """Tests for the Lua-scripted dedup + throttle + record call."""
+
+    async def test_admit_runs_script_with_both_keys(self, mock_redis, stream_id) -> None:
+        throttle = AlertThrottle(mock_redis, max_per_minute=5, dedup_ttl_s=7)
+        script = mock_redis.register_script.return_value
+        assert await throttle.admit(stream_id, "gun", "exact") == (False, False)
+        call = script.call_args
+        assert call.kwargs["keys"] == [f"dedup:{stream_id}:gun:exact", f"throttle:{stream_id}"]
+        assert call.kwargs["args"][1:3] == [7, 5]
+
+    async def test_admit_reports_duplicate(self, mock_redis, stream_id) -> None:
+        mock_redis.register_script.return_value.return_value = [1, 0]
+        throttle = AlertThrottle(mock_redis)
+        assert await throttle.admit(stream_id, "gun", "exact") == (True, False)
+
+    async def test_admit_reports_throttled(self, mock_redis, stream_id) -> None:
+        mock_redis.register_script.return_value.return_value = [0, 1]
+        throttle = AlertThrottle(mock_redis)
+        assert await throttle.admit(stream_id, "gun", "exact") == (False, True)
+
+    async def test_admit_members_are_distinct(self, mock_redis, stream_id) -> None:
+        throttle = AlertThrottle(mock_redis)
+        script = mock_redis.register_script.return_value
+        await throttle.admit(stream_id, "gun", "exact")
+        await throttle.admit(stream_id, "gun", "exact")
+        members = [c.kwargs["args"][3] for c in script.call_args_list]
+        assert members[0] != members[1]
+
+    async def test_admit_batch_uses_one_pipeline(self, mock_redis, stream_id) -> None:
+        pipe = mock_redis.pipeline()
+        pipe.execute = AsyncMock(return_value=[[0, 0], [1, 0]])
+        throttle = AlertThrottle(mock_redis)
+        script = mock_redis.register_script.return_value
+        result = await throttle.admit_batch(
+            [(stream_id, "gun", "exact"), (stream_id, "gun", "exact")],
+        )
+        assert result == [(False, False), (True, False)]
+        pipe.execute.assert_awaited_once()
+        assert all(c.kwargs["client"] is pipe for c in script.call_args_list)
+
+    async def test_admit_batch_empty(self, mock_redis) -> None:
+        throttle = AlertThrottle(mock_redis)
+        assert await throttle.admit_batch([]) == []
+        mock_redis.pipeline.assert_not_called()
@@ -7,6 +7,8 @@ and error handling for failed deliveries.
 
 from __future__ import annotations
 
+import asyncio
+import json
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -37,7 +39,7 @@ class TestWebhookDelivery:
         assert result is True
         client.post.assert_awaited_once()
         call_kwargs = client.post.call_args
-        assert call_kwargs.kwargs["json"]["matched_rule"] == "gun"
+        assert json.loads(call_kwargs.kwargs["content"])["matched_rule"] == "gun"
 
     async def test_send_includes_custom_headers(self, sample_alert) -> None:
         ch = WebhookChannel(
@@ -120,14 +122,26 @@ class TestWebhookRetry:
 class TestWebhookClose:
     """Tests for resource cleanup."""
 
-    async def test_close_closes_client(self) -> None:
-        ch = WebhookChannel(url=_TEST_URL)
-        mock_client = AsyncMock()
-        mock_client.is_closed = False
-        ch._client = mock_client
-        await ch.close()
-        mock_client.aclose.assert_awaited_once()
-        assert ch._client is None
+    async def test_channels_share_one_client(self) -> None:
+        first = WebhookChannel(url=_TEST_URL)
+        second = WebhookChannel(url="https://example.org/hook")
+        client = await first._get_client()
+        assert await second._get_client() is client
+        await first.close()
+        await second.close()
+
+    async def test_close_releases_shared_client(self) -> None:
+        first = WebhookChannel(url=_TEST_URL)
+        second = WebhookChannel(url=_TEST_URL)
+        client = await first._get_client()
+        await second._get_client()
+
+        await first.close()
+        assert first._client is None
+        assert not client.is_closed
+
+        await second.close()
+        assert client.is_closed
 
     async def test_close_noop_when_no_client(self) -> None:
         ch = WebhookChannel(url=_TEST_URL)
@@ -152,3 +166,33 @@ class TestWebhookDefaults:
         ch = WebhookChannel(url=_TEST_URL)
         assert ch.name == "webhook"
 
+
+# ── concurrency ──
+
+
+class TestWebhookConcurrency:
+    """Tests for concurrent deliveries sharing one channel."""
+
+    async def test_concurrent_sends_retry_independently(self, sample_alert) -> None:
+        ch = WebhookChannel(url=_TEST_URL, max_attempts=2)
+        fail_resp = httpx.Response(500, request=httpx.Request("POST", _TEST_URL))
+        ok_resp = httpx.Response(200, request=httpx.Request("POST", _TEST_URL))
+
+        responses = iter([fail_resp, fail_resp, ok_resp, ok_resp])
+
+        async def _post(*_args, **_kwargs) -> httpx.Response:
+            # Yield so both deliveries are in flight before either retries.
+            await asyncio.sleep(0)
+            return next(responses)
+
+        with patch.object(ch, "_get_client") as mock_gc, patch.object(
+            ch._retrying, "sleep", new=AsyncMock()
+        ):
+            client = AsyncMock()
+            client.post = AsyncMock(side_effect=_post)
+            mock_gc.return_value = client
+
+            results = await asyncio.gather(ch.send(sample_alert), ch.send(sample_alert))
+
+        assert results == [True, True]
+        assert client.post.await_count == 4
@@ -7,6 +7,7 @@ lifecycle management.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock
 
@@ -107,6 +108,24 @@ class TestWebSocketBroadcast:
         assert data["matched_rule"] == "gun"
         assert data["alert_type"] == "keyword"
 
+    async def test_broadcast_drops_client_that_times_out(
+        self, stream_id: str, sample_alert
+    ) -> None:
+        ch = WebSocketChannel(send_timeout=0.01)
+        good_ws = AsyncMock()
+        slow_ws = AsyncMock()
+
+        async def _hang(_payload: str) -> None:
+            await asyncio.sleep(1)
+
+        slow_ws.send.side_effect = _hang
+        ch.register(stream_id, good_ws)
+        ch.register(stream_id, slow_ws)
+
+        count = await ch.broadcast(stream_id, sample_alert)
+        assert count == 1
+        assert ch.clients[stream_id] == {good_ws}
+
     async def test_broadcast_removes_stream_key_when_all_stale(
         self, stream_id: str, sample_alert
     ) -> None:
@@ -138,6 +157,14 @@ class TestWebSocketSend:
         ch = WebSocketChannel()
         assert await ch.send(sample_alert) is False
 
+    async def test_send_prepared_reuses_payload(self, sample_alert) -> None:
+        ch = WebSocketChannel()
+        ws = AsyncMock()
+        ch.register(str(sample_alert.stream_id), ws)
+        payload = sample_alert.model_dump_json()
+        assert await ch.send_prepared(sample_alert, payload) is True
+        assert ws.send.call_args[0][0] is payload
+
 
 # ── close ──
 
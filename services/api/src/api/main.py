@@ -68,7 +68,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.redis = redis
 
     try:
-        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from tg_common.db.connection import get_session_factory, init_engine
 
         db_url = os.getenv(
             "TG_DB_URI",
@@ -77,8 +77,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         # Railway (and most cloud providers) supply postgresql:// — asyncpg requires postgresql+asyncpg://
         if db_url.startswith("postgresql://"):
             db_url = db_url.replace("postgresql://", "postgresql+asyncpg://", 1)
-        engine = create_async_engine(db_url, echo=False)
-        app.state.db_session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        # Shared engine, pool pre-warmed so early requests skip the handshakes.
+        await init_engine(db_url)
+        app.state.db_session_factory = get_session_factory()
     except Exception:  # pragma: no cover
         app.state.db_session_factory = None
 
@@ -88,6 +89,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     r = getattr(app.state, "redis", None)
     if r:
         await r.close()
+    if app.state.db_session_factory is not None:
+        from tg_common.db.connection import dispose_engine
+
+        await dispose_engine()
 
 
 # ── Prometheus metrics ──
@@ -118,7 +118,10 @@ async def verify_segment(
             TranscriptSegmentORM.segment_id >= anchor.first_segment_id,
             TranscriptSegmentORM.segment_id <= anchor.last_segment_id,
         )
-        .order_by(TranscriptSegmentORM.created_at.asc()),
+        .order_by(
+            TranscriptSegmentORM.created_at.asc(),
+            TranscriptSegmentORM.segment_id.asc(),
+        ),
     )
     all_hashes = [r[0] for r in range_result.all() if r[0]]
 
@@ -42,7 +42,9 @@ from api.schemas.file_analyze_schemas import (
     FileAnalyzeSummary,
 )
 
+from tg_common.db.bulk import ColumnBatch, bulk_insert_columns
 from tg_common.db.orm_models import AlertChannelConfigORM, AlertORM, SessionORM, StreamORM, TranscriptSegmentORM
+from tg_common.utils import uuid7
 
 logger = structlog.get_logger()
 
@@ -339,7 +341,7 @@ async def _run_pipeline(
                 speaker_raw = utt.get("speaker")
                 transcript_out.append(
                     FileAnalyzeSegment(
-                        segment_id=_uuid.uuid4(),
+                        segment_id=uuid7(),
                         speaker_id=f"speaker_{speaker_raw}" if speaker_raw is not None else None,
                         start_offset_ms=int(float(utt.get("start", 0)) * 1000),
                         end_offset_ms=int(float(utt.get("end", 0)) * 1000),
@@ -365,7 +367,7 @@ async def _run_pipeline(
                         spk = current_words[0].get("speaker")
                         transcript_out.append(
                             FileAnalyzeSegment(
-                                segment_id=_uuid.uuid4(),
+                                segment_id=uuid7(),
                                 speaker_id=f"speaker_{spk}" if spk is not None else None,
                                 start_offset_ms=int(float(current_words[0].get("start", 0)) * 1000),
                                 end_offset_ms=int(float(current_words[-1].get("end", 0)) * 1000),
@@ -384,7 +386,7 @@ async def _run_pipeline(
                     spk = current_words[0].get("speaker")
                     transcript_out.append(
                         FileAnalyzeSegment(
-                            segment_id=_uuid.uuid4(),
+                            segment_id=uuid7(),
                             speaker_id=f"speaker_{spk}" if spk is not None else None,
                             start_offset_ms=int(float(current_words[0].get("start", 0)) * 1000),
                             end_offset_ms=int(float(current_words[-1].get("end", 0)) * 1000),
@@ -458,7 +460,7 @@ async def _run_pipeline(
                     # Create alert for each match
                     alerts_out.append(
                         FileAnalyzeAlert(
-                            alert_id=_uuid.uuid4(),
+                            alert_id=uuid7(),
                             alert_type="keyword",
                             severity=rule["severity"],
                             matched_rule=rule["rule_id"],
@@ -528,8 +530,10 @@ async def _run_pipeline(
             try:
                 async with db_session_factory() as db_sess:
                     base_time = _utc_now()
+                    seg_batch = ColumnBatch(TranscriptSegmentORM)
+                    alert_batch = ColumnBatch(AlertORM)
                     for seg in transcript_out:
-                        seg_orm = TranscriptSegmentORM(
+                        seg_batch.append(
                             segment_id=seg.segment_id,
                             session_id=session_id,
                             stream_id=stream_id,
@@ -546,7 +550,6 @@ async def _run_pipeline(
                             sentiment_label=seg.sentiment_label,
                             sentiment_score=seg.sentiment_score,
                         )
-                        db_sess.add(seg_orm)
 
                     for alert in alerts_out:
                         # Map alert_type: pipeline uses "keyword_match" but DB enum expects "keyword"
@@ -564,7 +567,7 @@ async def _run_pipeline(
                         if db_severity not in ("low", "medium", "high", "critical"):
                             db_severity = "medium"
 
-                        alert_orm = AlertORM(
+                        alert_batch.append(
                             alert_id=alert.alert_id,
                             session_id=session_id,
                             stream_id=stream_id,
@@ -577,7 +580,9 @@ async def _run_pipeline(
                             speaker_id=alert.speaker_id,
                             asr_backend_used=asr_backend,
                         )
-                        db_sess.add(alert_orm)
+
+                    await bulk_insert_columns(db_sess, seg_batch)
+                    await bulk_insert_columns(db_sess, alert_batch)
                     await db_sess.commit()
                 logger.info("file_analyze_db_persisted", job_id=job_id,
                             segments=len(transcript_out), alerts=len(alerts_out))
@@ -788,16 +793,12 @@ async def delete_job(
         raise HTTPException(status_code=404, detail="Job not found")
 
     stream_id = job.get("stream_id")
-    session_id = job.get("session_id")
 
     # Remove DB records if possible
     if db is not None and stream_id:
         try:
             from sqlalchemy import delete as sa_delete
-            await db.execute(sa_delete(AlertORM).where(AlertORM.stream_id == stream_id))
-            await db.execute(sa_delete(TranscriptSegmentORM).where(TranscriptSegmentORM.stream_id == stream_id))
-            if session_id:
-                await db.execute(sa_delete(SessionORM).where(SessionORM.session_id == session_id))
+            # ON DELETE CASCADE removes the stream's sessions, segments and alerts.
             await db.execute(sa_delete(StreamORM).where(StreamORM.stream_id == stream_id))
             await db.commit()
         except Exception:
@@ -1025,7 +1026,7 @@ async def scan_keyword(
             hit = kw.lower() in seg_text_lower
 
         if hit:
-            alert_id = _uuid.uuid4()
+            alert_id = uuid7()
             hits.append(_ScanKeywordHit(
                 alert_id=str(alert_id),
                 matched_text=kw,
@@ -10,7 +10,8 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Request
 from pydantic import BaseModel
-from sqlalchemy import text
+
+from tg_common.db.connection import check_database_health
 
 
 router = APIRouter(tags=["health"])
@@ -25,17 +26,13 @@ class HealthResponse(BaseModel):
 async def health_check(request: Request) -> HealthResponse:
     services: dict[str, str] = {}
 
-    # Database
-    try:
-        factory = getattr(request.app.state, "db_session_factory", None)
-        if factory:
-            async with factory() as session:
-                await session.execute(text("SELECT 1"))
-            services["database"] = "healthy"
-        else:
-            services["database"] = "not_configured"
-    except Exception:
-        services["database"] = "unhealthy"
+    # Database — probed over the NullPool health engine, never the
+    # application pool, so an exhausted pool cannot stall the check.
+    if getattr(request.app.state, "db_session_factory", None):
+        healthy = await check_database_health()
+        services["database"] = "healthy" if healthy else "unhealthy"
+    else:
+        services["database"] = "not_configured"
 
     # Redis
     try:
@@ -25,6 +25,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from api.dependencies import get_db_session, get_redis
+from tg_common.utils import uuid7
 
 logger = structlog.get_logger()
 
@@ -421,7 +422,7 @@ async def _stream_captions_to_redis(
 
         for idx, cap in enumerate(captions):
             seg = FileAnalyzeSegment(
-                segment_id=_uuid.uuid4(),
+                segment_id=uuid7(),
                 speaker_id=None,
                 start_offset_ms=cap["start_ms"],
                 end_offset_ms=cap["end_ms"],
@@ -458,7 +459,7 @@ async def _stream_captions_to_redis(
             matches = _match_keywords(combined, keyword_rules)
             for m in matches:
                 alerts_out.append(FileAnalyzeAlert(
-                    alert_id=_uuid.uuid4(),
+                    alert_id=uuid7(),
                     alert_type="keyword",
                     severity=m.get("severity", "medium"),
                     matched_rule=m.get("rule_id"),
@@ -1270,7 +1271,7 @@ async def _publish_and_dispatch_alerts(
         return
 
     for m in matches:
-        alert_id = str(_uuid.uuid4())
+        alert_id = str(uuid7())
         alert_payload = {
             "alert_id": alert_id,
             "alert_type": "keyword",
@@ -7,7 +7,9 @@ and service status reporting.
 
 from __future__ import annotations
 
+from unittest.mock import AsyncMock, MagicMock, patch
 
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
@@ -35,3 +37,13 @@ class TestHealthCheck:
         data = resp.json()
         # With no real backends, all are "not_configured" => overall "healthy"
         assert data["status"] in ("healthy", "degraded")
+
+    def test_health_database_uses_health_engine(self, app: FastAPI):
+        factory = MagicMock()
+        app.state.db_session_factory = factory
+        probe = AsyncMock(return_value=False)
+        with patch("api.routers.health.check_database_health", probe):
+            data = TestClient(app).get("/health").json()
+        assert data["services"]["database"] == "unhealthy"
+        probe.assert_awaited_once()
+        factory.assert_not_called()
@@ -11,7 +11,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from collections.abc import AsyncIterator
 
-from tg_common.models import TranscriptToken
+from tg_common.models.transcript_fast import TranscriptToken
 
 
 class ASREngine(ABC):
@@ -16,7 +16,7 @@ from typing import Any
 import structlog
 from deepgram import DeepgramClient, LiveOptions, LiveTranscriptionEvents
 
-from tg_common.models import TranscriptToken, WordTimestamp
+from tg_common.models.transcript_fast import TranscriptToken, WordTimestamp
 
 from asr.engine_base import ASREngine
 
@@ -18,7 +18,7 @@ import numpy as np
 import structlog
 from faster_whisper import WhisperModel
 
-from tg_common.models import TranscriptToken, WordTimestamp
+from tg_common.models.transcript_fast import TranscriptToken, WordTimestamp
 
 from asr.engine_base import ASREngine
 
@@ -15,7 +15,7 @@ from enum import Enum
 import structlog
 from circuitbreaker import CircuitBreakerError  # re-exported for callers
 
-from tg_common.models import TranscriptToken
+from tg_common.models.transcript_fast import TranscriptToken
 
 from asr.engine_base import ASREngine
 
@@ -110,7 +110,7 @@ class ASRRouter:
 
         try:
             async for token in self._failover.stream_audio(chunk):
-                token_json = token.model_dump_json()
+                token_json = token.to_json()
                 await self._redis.xadd(
                     out_key,
                     {"data": token_json},
@@ -10,7 +10,7 @@ from collections.abc import AsyncIterator
 
 import pytest
 
-from tg_common.models import TranscriptToken
+from tg_common.models.transcript_fast import TranscriptToken
 
 from asr.engine_base import ASREngine
 from asr.engine_registry import (
@@ -15,7 +15,7 @@ from unittest.mock import patch
 import pytest
 from circuitbreaker import CircuitBreakerError
 
-from tg_common.models import TranscriptToken
+from tg_common.models.transcript_fast import TranscriptToken
 
 from asr.engine_base import ASREngine
 from asr.failover import ASRCircuitBreaker, ASRFailoverManager, CircuitState
@@ -13,10 +13,10 @@ enriched tokens to ``enriched_tokens:{stream_id}``.
 from __future__ import annotations
 
 import asyncio
-import json
 from contextlib import asynccontextmanager
 from typing import Any, AsyncIterator
 
+import orjson
 import structlog
 import uvicorn
 from fastapi import FastAPI
@@ -110,16 +110,19 @@ async def _diarize_loop(
                 merger = _get_merger(stream_id)
                 merger.update_segments(segments)
 
-                # Publish segment events.
-                for seg in segments:
-                    await redis.publish(
-                        f"diarization_events:{stream_id}",
+                # Publish segment events in one pipelined round-trip.
+                channel = f"diarization_events:{stream_id}"
+                await redis.publish_many([
+                    (
+                        channel,
                         {
                             "speaker_id": seg.speaker_id,
                             "start_ms": seg.start_ms,
                             "end_ms": seg.end_ms,
                         },
                     )
+                    for seg in segments
+                ])
                 logger.debug(
                     "diarization_complete",
                     stream_id=stream_id,
@@ -147,38 +150,41 @@ async def _enrich_loop(
     while True:
         try:
             entries = await redis.xread({stream_key: last_id}, count=10, block=1000)
+            out: list[dict[str, Any]] = []
             for _stream, messages in entries:
                 for msg_id, fields in messages:
                     last_id = msg_id
                     try:
-                        token_data: dict[str, Any] = json.loads(
+                        # Tokens stay plain dicts in transit; they are
+                        # validated once by the NLP and storage consumers.
+                        token_data: dict[str, Any] = orjson.loads(
                             fields.get("data", "{}")
                         )
                         merger = _get_merger(stream_id)
-                        enriched_list = merger.merge([token_data])
-                        for et in enriched_list:
-                            await redis.xadd(
-                                f"enriched_tokens:{stream_id}",
-                                {
-                                    "data": json.dumps({
-                                        "text": et.text,
-                                        "is_final": et.is_final,
-                                        "start_ms": et.start_ms,
-                                        "end_ms": et.end_ms,
-                                        "confidence": et.confidence,
-                                        "language": et.language,
-                                        "speaker_id": et.speaker_id,
-                                        "stream_id": stream_id,
-                                        "session_id": session_id,
-                                    }),
-                                },
-                            )
+                        out.extend(
+                            {
+                                "data": orjson.dumps({
+                                    "text": et.text,
+                                    "is_final": et.is_final,
+                                    "start_ms": et.start_ms,
+                                    "end_ms": et.end_ms,
+                                    "confidence": et.confidence,
+                                    "language": et.language,
+                                    "speaker_id": et.speaker_id,
+                                    "stream_id": stream_id,
+                                    "session_id": session_id,
+                                }),
+                            }
+                            for et in merger.merge([token_data])
+                        )
                     except Exception:
                         logger.exception(
                             "enrich_token_error",
                             stream_id=stream_id,
                             msg_id=msg_id,
                         )
+            # Append the whole read batch in one pipelined round-trip.
+            await redis.xadd_many(f"enriched_tokens:{stream_id}", out)
         except asyncio.CancelledError:
             break
         except Exception:
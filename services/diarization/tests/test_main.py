@@ -82,7 +82,9 @@ class TestDiarizeLoop:
 
         # Pipeline should have been called once with accumulated bytes
         pipeline.diarize.assert_called_once()
-        assert mock_redis.publish.call_count == 2  # 2 segments published
+        # Both segments published in a single pipelined batch.
+        mock_redis.publish_many.assert_awaited_once()
+        assert len(mock_redis.publish_many.call_args[0][0]) == 2
 
     @pytest.mark.asyncio
     async def test_skips_when_not_enough_data(self, mock_redis: AsyncMock) -> None:
@@ -146,10 +148,11 @@ class TestEnrichLoop:
         await _enrich_loop("s1", "sess1", mock_redis)
 
         # Should have published to enriched_tokens:s1
-        mock_redis.xadd.assert_called_once()
-        call_args = mock_redis.xadd.call_args
+        mock_redis.xadd_many.assert_called_once()
+        call_args = mock_redis.xadd_many.call_args
         assert call_args[0][0] == "enriched_tokens:s1"
-        published = json.loads(call_args[0][1]["data"])
+        (entry,) = call_args[0][1]
+        published = json.loads(entry["data"])
         assert published["speaker_id"] == "SPEAKER_00"
         assert published["text"] == "hello world"
 
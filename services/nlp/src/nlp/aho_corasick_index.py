@@ -8,6 +8,7 @@ hot-reload when keyword configurations change.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from uuid import UUID
 
@@ -16,6 +17,12 @@ import structlog
 
 logger = structlog.get_logger()
 
+# Compiled automatons keyed by the exact ``(keyword, rule_id)`` sequence
+# they were built from, so hot-reloads that leave the exact rules
+# untouched (or engines sharing a rule set) skip reconstruction.
+_AUTOMATON_CACHE: OrderedDict[tuple[tuple[str, UUID], ...], ahocorasick.Automaton] = OrderedDict()
+_AUTOMATON_CACHE_SIZE = 8
+
 
 @dataclass(frozen=True)
 class AhoMatch:
@@ -35,8 +42,9 @@ class AhoMatch:
 class AhoCorasickIndex:
     """Manages a pyahocorasick ``Automaton`` for exact multi-pattern matching.
 
-    The automaton is rebuilt from scratch whenever rules change (hot-reload).
-    All keywords are stored and searched in lower-case for case-insensitive
+    The automaton is rebuilt whenever rules change (hot-reload); automatons
+    for previously seen rule sets are reused from a small module-level
+    cache.  All keywords are stored and searched in lower-case for case-insensitive
     matching.
     """
 
@@ -53,19 +61,26 @@ class AhoCorasickIndex:
             rules: Iterable of ``(keyword_text, rule_id)`` tuples.  Only
                 rules with ``match_type == 'exact'`` should be passed here.
         """
-        automaton = ahocorasick.Automaton()
-        count = 0
-        for keyword, rule_id in rules:
-            key = keyword.lower()
-            automaton.add_word(key, (key, rule_id))
-            count += 1
-        if count:
-            automaton.make_automaton()
-            self._automaton = automaton
-        else:
+        key = tuple((keyword.lower(), rule_id) for keyword, rule_id in rules)
+        self._pattern_count = len(key)
+        if not key:
             self._automaton = None
-        self._pattern_count = count
-        logger.info("aho_corasick_index_built", pattern_count=count)
+            return
+        automaton = _AUTOMATON_CACHE.get(key)
+        if automaton is not None:
+            _AUTOMATON_CACHE.move_to_end(key)
+            self._automaton = automaton
+            logger.debug("aho_corasick_index_reused", pattern_count=len(key))
+            return
+        automaton = ahocorasick.Automaton()
+        for keyword, rule_id in key:
+            automaton.add_word(keyword, (keyword, rule_id))
+        automaton.make_automaton()
+        _AUTOMATON_CACHE[key] = automaton
+        if len(_AUTOMATON_CACHE) > _AUTOMATON_CACHE_SIZE:
+            _AUTOMATON_CACHE.popitem(last=False)
+        self._automaton = automaton
+        logger.info("aho_corasick_index_built", pattern_count=len(key))
 
     def search(self, text: str) -> list[AhoMatch]:
         """Search *text* for all exact-match keywords.
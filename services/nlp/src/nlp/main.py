@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import json
 from contextlib import asynccontextmanager
-from typing import AsyncIterator
+from typing import Any, AsyncIterator
 
 import structlog
 import uvicorn
@@ -20,12 +20,13 @@ from prometheus_client import Counter, Histogram, make_asgi_app
 
 from tg_common.messaging.redis_client import RedisClient
 from tg_common.models import TranscriptToken
+from tg_common.models.transcript import validate_token_json
 
 from nlp import health
 from nlp.keyword_engine import KeywordEngine
 from nlp.pii_redactor import PiiRedactor
 from nlp.rule_loader import RuleLoader
-from nlp.sentiment_engine import SentimentEngine
+from nlp.sentiment_engine import SentimentEngine, normalise_label
 
 logger = structlog.get_logger()
 
@@ -113,26 +114,24 @@ async def _process_token(
         keyword_task, sentiment_task, pii_task
     )
 
-    # Publish keyword match events
-    for evt in keyword_events:
-        await redis.publish(
-            f"match_events:{stream_id}",
-            evt.model_dump(mode="json"),
-        )
-
-    # Publish sentiment escalation events
+    # Publish keyword match and sentiment escalation events in one round-trip
+    events: list[tuple[str, dict[str, Any] | str]] = [
+        (f"match_events:{stream_id}", evt.model_dump(mode="json"))
+        for evt in keyword_events
+    ]
     if escalation_event is not None:
-        await redis.publish(
-            f"sentiment_events:{stream_id}",
-            escalation_event.model_dump(mode="json"),
+        events.append(
+            (f"sentiment_events:{stream_id}", escalation_event.model_dump(mode="json")),
         )
+    await redis.publish_many(events)
 
-    # Build redacted token payload
+    # Build redacted token payload; the label must fit sentiment_label_enum.
+    sentiment_label = normalise_label(sentiment_result.label)
     redacted_payload = {
         "text_original": token.text,
         "text_redacted": pii_result.redacted_text,
         "entities_found": json.dumps(pii_result.entities_found),
-        "sentiment_label": sentiment_result.label.lower(),
+        "sentiment_label": sentiment_label,
         "sentiment_score": str(sentiment_result.score),
         "start_time": token.start_time.isoformat(),
         "end_time": token.end_time.isoformat(),
@@ -145,7 +144,7 @@ async def _process_token(
     ws_payload = json.dumps({
         "text": pii_result.redacted_text,
         "speaker_id": getattr(token, "speaker_id", None),
-        "sentiment_label": sentiment_result.label.lower(),
+        "sentiment_label": sentiment_label,
         "sentiment_score": round(sentiment_result.score, 4),
         "start_time": token.start_time.isoformat(),
         "end_time": token.end_time.isoformat(),
@@ -177,8 +176,7 @@ async def _consume_stream(
                 for msg_id, fields in messages:
                     last_id = msg_id
                     try:
-                        token_data = json.loads(fields.get("data", "{}"))
-                        token = TranscriptToken.model_validate(token_data)
+                        token = validate_token_json(fields.get("data", "{}"))
                         await _process_token(
                             token,
                             stream_id,
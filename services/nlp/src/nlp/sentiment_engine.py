@@ -30,6 +30,20 @@ DEFAULT_ESCALATION_SCORE_THRESHOLD = 0.8
 DEFAULT_ROLLING_WINDOW_S = 30.0
 
 
+def normalise_label(label: str) -> str:
+    """Map HF output labels to positive/negative/neutral.
+
+    Anything other than ``POSITIVE``/``NEGATIVE`` becomes ``neutral`` so
+    the result always fits ``transcript_segments.sentiment_label``.
+    """
+    upper = label.upper()
+    if upper == "POSITIVE":
+        return "positive"
+    if upper == "NEGATIVE":
+        return "negative"
+    return "neutral"
+
+
 @dataclass
 class SentimentResult:
     """Raw output from the sentiment model.
@@ -124,7 +138,7 @@ class SentimentEngine:
         result = self._parse_result(raw)
 
         # Normalise label to lowercase
-        sentiment_label = self._normalise_label(result.label)
+        sentiment_label = normalise_label(result.label)
 
         # Update rolling history
         sid = str(stream_id)
@@ -164,16 +178,6 @@ class SentimentEngine:
             )
         return SentimentResult(label="NEUTRAL", score=0.0)
 
-    @staticmethod
-    def _normalise_label(label: str) -> str:
-        """Map HF output labels to positive/negative/neutral."""
-        upper = label.upper()
-        if upper == "POSITIVE":
-            return "positive"
-        if upper == "NEGATIVE":
-            return "negative"
-        return "neutral"
-
     def _evict(self, stream_id: str, latest_end_s: float) -> None:
         """Drop records older than the rolling window."""
         cutoff = latest_end_s - self._rolling_window_s
@@ -110,5 +110,6 @@ def mock_redis() -> AsyncMock:
     redis.xadd = AsyncMock(return_value="1-0")
     redis.xread = AsyncMock(return_value=[])
     redis.publish = AsyncMock(return_value=1)
+    redis.publish_many = AsyncMock(return_value=[])
     redis.health_check = AsyncMock(return_value=True)
     return redis
@@ -37,6 +37,14 @@ class TestBuild:
         index.build([("fire", uuid4()), ("help", uuid4())])
         assert index.pattern_count == 2
 
+    def test_same_rules_reuse_cached_automaton(self) -> None:
+        rules = [("gun", uuid4()), ("Fire", uuid4())]
+        first, second = AhoCorasickIndex(), AhoCorasickIndex()
+        first.build(rules)
+        second.build(list(rules))
+        assert first._automaton is second._automaton
+        assert second.search("FIRE")[0].keyword == "fire"
+
     def test_initial_state_not_ready(self) -> None:
         index = AhoCorasickIndex()
         assert index.is_ready is False
@@ -136,8 +136,7 @@ class TestMixedRules:
 
     def test_disabled_rule_not_matched(self) -> None:
         engine = KeywordEngine()
-        rule = _make_rule("gun")
-        rule.enabled = False
+        rule = _make_rule("gun").model_copy(update={"enabled": False})
         engine.load_rules([rule])
         events = engine.detect("he has a gun", 0.0, 1.0, STREAM_ID, SESSION_ID)
         assert events == []
@@ -12,7 +12,7 @@ from uuid import UUID
 
 import pytest
 
-from nlp.sentiment_engine import SentimentEngine
+from nlp.sentiment_engine import SentimentEngine, normalise_label
 
 STREAM_ID = UUID("12345678-1234-5678-1234-567812345678")
 SESSION_ID = UUID("87654321-4321-8765-4321-876543218765")
@@ -55,6 +55,11 @@ class TestSentimentClassification:
         assert result.label == "NEUTRAL"
         assert event is None
 
+    def test_normalise_label_maps_unknown_to_neutral(self) -> None:
+        assert normalise_label("POSITIVE") == "positive"
+        assert normalise_label("negative") == "negative"
+        assert normalise_label("LABEL_1") == "neutral"
+
 
 class TestSentimentEscalation:
     """Tests for escalation triggering on persistent negative sentiment."""
@@ -24,30 +24,28 @@ logger = structlog.get_logger(__name__)
 DEFAULT_INTERVAL_S = 60
 
 
-def _hash_pair(left: str, right: str) -> str:
-    """SHA-256 hash of two concatenated hex digests."""
-    return hashlib.sha256((left + right).encode()).hexdigest()
-
-
 def build_merkle_root(hashes: list[str]) -> str:
     """Build a Merkle root from an ordered list of hex-digest hashes.
 
-    If the list has an odd number of elements the last element is
+    If a layer has an odd number of elements the last element is
     duplicated.  Returns the single root hash.
+
+    Each layer is hashed in one comprehension with ``hashlib.sha256``
+    bound locally; hashlib is backed by OpenSSL, which already uses the
+    CPU's SHA extensions, so the remaining cost is Python call overhead.
     """
     if not hashes:
         raise ValueError("Cannot build Merkle root from empty list")
-    if len(hashes) == 1:
-        return hashes[0]
 
+    sha256 = hashlib.sha256
     layer = list(hashes)
     while len(layer) > 1:
-        next_layer: list[str] = []
-        for i in range(0, len(layer), 2):
-            left = layer[i]
-            right = layer[i + 1] if i + 1 < len(layer) else layer[i]
-            next_layer.append(_hash_pair(left, right))
-        layer = next_layer
+        if len(layer) % 2:
+            layer.append(layer[-1])
+        layer = [
+            sha256((left + right).encode()).hexdigest()
+            for left, right in zip(layer[::2], layer[1::2])
+        ]
     return layer[0]
 
 
@@ -100,7 +98,11 @@ class AuditHasher:
                     TranscriptSegmentORM.created_at,
                 )
                 .where(TranscriptSegmentORM.segment_hash.is_not(None))
-                .order_by(TranscriptSegmentORM.created_at.asc())
+                # segment_id breaks ties between rows sharing a server now().
+                .order_by(
+                    TranscriptSegmentORM.created_at.asc(),
+                    TranscriptSegmentORM.segment_id.asc(),
+                )
             )
             if last_anchor_at is not None:
                 stmt = stmt.where(TranscriptSegmentORM.created_at > last_anchor_at)
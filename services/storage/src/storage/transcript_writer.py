@@ -9,7 +9,6 @@ restricted-access original text storage.
 from __future__ import annotations
 
 import hashlib
-import json
 from datetime import datetime
 from typing import Any, Callable
 from uuid import UUID
@@ -18,7 +17,7 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from tg_common.db.orm_models import TranscriptSegmentORM
-from tg_common.models.transcript import TranscriptSegment
+from tg_common.models.transcript import TranscriptSegment, validate_segment_json
 
 logger = structlog.get_logger(__name__)
 
@@ -74,7 +73,7 @@ class TranscriptWriter:
 
         word_ts_raw: list[dict[str, Any]] | None = None
         if segment.word_timestamps:
-            word_ts_raw = [wt.model_dump() for wt in segment.word_timestamps]
+            word_ts_raw = segment.word_timestamps.to_records()
 
         orm_obj = TranscriptSegmentORM(
             segment_id=segment.segment_id,
@@ -124,8 +123,7 @@ class TranscriptWriter:
         Returns ``None`` when the message cannot be parsed.
         """
         try:
-            data = json.loads(raw)
-            segment = TranscriptSegment(**data)
+            segment = validate_segment_json(raw)
         except Exception:
             logger.exception("transcript_parse_failed")
             return None
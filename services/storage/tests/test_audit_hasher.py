@@ -80,6 +80,18 @@ class TestBuildMerkleRoot:
         # Deterministic
         assert root == build_merkle_root(hashes)
 
+    def test_odd_inner_layer_duplicates_last(self):
+        from storage.audit_hasher import build_merkle_root
+
+        def pair(a: str, b: str) -> str:
+            return hashlib.sha256((a + b).encode()).hexdigest()
+
+        h = [hashlib.sha256(f"seg{i}".encode()).hexdigest() for i in range(6)]
+        # 6 -> 3 leaves an odd inner layer, whose last node is duplicated.
+        l1 = [pair(h[0], h[1]), pair(h[2], h[3]), pair(h[4], h[5])]
+        l2 = [pair(l1[0], l1[1]), pair(l1[2], l1[2])]
+        assert build_merkle_root(h) == pair(l2[0], l2[1])
+
 
 # ─── AuditHasher.anchor ──────────────────────────────────────────
 
@@ -153,6 +153,9 @@ class TestWriteSegment:
         assert result.word_timestamps is not None
         assert len(result.word_timestamps) == 1
         assert result.word_timestamps[0]["word"] == "hello"
+        # Archived quantised, not as a dequantised float.
+        assert result.word_timestamps[0]["confidence_q"] == 230
+        assert "confidence" not in result.word_timestamps[0]
 
     async def test_empty_word_timestamps(self, mock_db_session, mock_db_session_factory):
         from storage.transcript_writer import TranscriptWriter